@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_tracker.apps.tasks"
+
+    def ready(self):
+        from task_tracker.lookups import ILIKE_LOOKUPS
+
+        # The description filters use these lookups, see `Task.Meta.indexes`. They are
+        # registered on that field only so other text columns keep Django's UPPER() LIKE
+        description = self.get_model('Task')._meta.get_field('description')
+        for lookup in ILIKE_LOOKUPS:
+            description.register_lookup(lookup)
@@ -15,6 +15,10 @@ class TaskFactory(factory.django.DjangoModelFactory):
     completed = False
     creation_time = factory.LazyFunction(timezone.now)
 
+    class Params:
+        # Skips Faker for tests that don't care about the description: TaskFactory(minimal=True)
+        minimal = factory.Trait(description='x')
+
     @classmethod
     def _create(cls, model_class, *args, **kwargs):
         """Override the default _create method to handle auto_now fields."""
@@ -37,6 +41,38 @@ class TaskFactory(factory.django.DjangoModelFactory):
 
         return obj
 
+    @classmethod
+    def create_batch_bulk(cls, size, **kwargs):
+        """
+        Create `size` tasks with a single INSERT instead of one per task.
+
+        `creation_time`/`updated_at` overrides are applied afterwards with a single UPDATE for
+        the whole batch, since `bulk_create` also fills in the `auto_now`/`auto_now_add` fields.
+        """
+        creation_time = kwargs.pop('creation_time', None)
+        updated_at = kwargs.pop('updated_at', None)
+
+        # Built tasks can't point to unsaved users, so the whole batch shares one saved user
+        if 'user' not in kwargs:
+            kwargs['user'] = UserFactory()
+
+        tasks = Task.objects.bulk_create(cls.build_batch(size, **kwargs))
+
+        updates = {}
+        if creation_time is not None:
+            updates['creation_time'] = creation_time
+
+        if updated_at is not None:
+            updates['updated_at'] = updated_at
+
+        if updates:
+            Task.objects.filter(pk__in=[task.pk for task in tasks]).update(**updates)
+            for task in tasks:
+                for field, value in updates.items():
+                    setattr(task, field, value)
+
+        return tasks
+
 
 class CompletedTaskFactory(TaskFactory):
     """Factory for creating completed Task instances."""
@@ -1,7 +1,13 @@
 import logging
+import re
+import string
 from datetime import datetime, time
-from typing import Tuple
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 
+from django.contrib.postgres.search import SearchQuery
+from django.core.exceptions import ValidationError
+from django.db import connections
 from django.db.models import QuerySet
 from django.utils import timezone
 
@@ -10,6 +16,246 @@ from task_tracker.apps.tasks.models import Task
 
 logger = logging.getLogger(__name__)
 
+_MIN_PREFILTER_LITERAL_LENGTH = 3
+MAX_DESCRIPTION_REGEX_LENGTH = 200
+# Characters with a special meaning somewhere in a PostgreSQL regex; a pattern without any of
+# them matches itself as a plain (case-insensitive) substring
+_REGEX_METACHARACTERS = frozenset('\\^$.|?*+()[]{}')
+# `{m}`, `{m,}` and `{m,n}` bounds; a `{` not followed by a digit is an ordinary character
+_BOUND_RE = re.compile(r'\{(\d+)(,(\d*))?\}')
+# PostgreSQL's largest repetition count (RE_DUP_MAX)
+_MAX_BOUND = 255
+# Escapes PostgreSQL accepts as a single letter: character entries, class shorthands and,
+# outside bracket expressions, constraints
+_ENTRY_ESCAPES = frozenset('abBefnrtv')
+_CLASS_ESCAPES = frozenset('dDsSwW')
+_CONSTRAINT_ESCAPES = frozenset('AmMyYZ')
+_HEX_ESCAPE_LENGTHS = {'u': 4, 'U': 8}
+
+
+class _RegexSummary(NamedTuple):
+    """What the description filter needs to know about a regex, see `_summarize_regex`."""
+    required_literal: Optional[str]
+    has_nested_unbounded_repeat: bool
+
+
+def _escape_end(value: str, start: int, group_count: int = 0, in_bracket: bool = False) -> int:
+    """Return the index after the escape at `start`, raising `ValueError` for escapes PostgreSQL rejects."""
+    if start + 1 == len(value):
+        raise ValueError("trailing backslash")
+    char = value[start + 1]
+    i = start + 2
+    if not char.isalnum() or char in _ENTRY_ESCAPES or char in _CLASS_ESCAPES:
+        return i
+    if char in _CONSTRAINT_ESCAPES and not in_bracket:
+        return i
+    if char == 'c':  # Control character, `\cX`
+        if i == len(value):
+            raise ValueError("incomplete \\c escape")
+        return i + 1
+    if char in _HEX_ESCAPE_LENGTHS:
+        digits = value[i:i + _HEX_ESCAPE_LENGTHS[char]]
+        if len(digits) < _HEX_ESCAPE_LENGTHS[char] or not all(d in string.hexdigits for d in digits):
+            raise ValueError(f"invalid escape \\{char}")
+        return i + len(digits)
+    if char == 'x':
+        end = i
+        while end < len(value) and value[end] in string.hexdigits:
+            end += 1
+        if end == i:
+            raise ValueError("invalid escape \\x")
+        return end
+    if char.isdigit():
+        end = i
+        while end < len(value) and value[end].isdigit():
+            end += 1
+        number = value[start + 1:end]
+        # `\0` and multi-digit escapes that aren't back references are octal character entries
+        if char != '0' and len(number) == 1 and (in_bracket or int(number) > group_count):
+            raise ValueError(f"invalid back reference \\{number}")
+        return end
+    raise ValueError(f"invalid escape \\{char}")
+
+
+def _bracket_expression_end(value: str, start: int) -> int:
+    """Return the index after the bracket expression opened at `start`, e.g. `[^a-z[:digit:]]`."""
+    i = start + 1
+    if value.startswith('^', i):
+        i += 1
+    if value.startswith(']', i):  # A leading `]` is part of the set
+        i += 1
+    while i < len(value):
+        char = value[i]
+        if char == '[' and value[i + 1:i + 2] in (':', '=', '.'):
+            # Character class (`[:alpha:]`), equivalence class or collating element
+            close = value.find(value[i + 1] + ']', i + 2)
+            if close == -1:
+                raise ValueError("unterminated character class")
+            i = close + 2
+        elif char == '\\':
+            i = _escape_end(value, i, in_bracket=True)
+        elif char == ']':
+            return i + 1
+        elif value.startswith('-', i + 1) and value[i + 2:i + 3] not in ('', ']', '[', '\\'):
+            # Range of plain characters, e.g. `a-z`
+            if value[i + 2] < char:
+                raise ValueError("invalid character range")
+            i += 3
+        else:
+            i += 1
+    raise ValueError("unterminated bracket expression")
+
+
+def _group_prefix_length(value: str, start: int) -> int:
+    """Return the length of the `(?:`, `(?=`, `(?!`, `(?<=` or `(?<!` prefix after the `(` at `start`."""
+    if not value.startswith('?', start + 1):
+        return 1
+    for prefix in ('?:', '?=', '?!', '?<=', '?<!'):
+        if value.startswith(prefix, start + 1):
+            return 1 + len(prefix)
+    raise ValueError("invalid group syntax")
+
+
+@lru_cache(maxsize=256)
+def _summarize_regex(value: str) -> _RegexSummary:
+    """
+    Scan a PostgreSQL (ARE) regex for its required literal and nested unbounded quantifiers.
+
+    The required literal is the longest run of ordinary characters in the top-level sequence,
+    so every match contains it. Runs end at escapes, groups and quantified characters, and no
+    literal is returned for top-level alternations or patterns with bracket expressions or
+    embedded options, whose characters PostgreSQL may read differently.
+
+    Raises `ValueError` for unbalanced parentheses, unterminated brackets, invalid escapes,
+    ranges and bounds, and quantifiers without an operand, which PostgreSQL rejects as well. Cached, as the pattern is scanned
+    both by the validator and by the filter.
+    """
+    if value.startswith('***='):
+        # The rest of the pattern is a literal string
+        return _RegexSummary(None, False)
+
+    allow_literal = True
+    i = 0
+    if value.startswith('***:'):
+        i = 4
+    if value.startswith('(?', i) and value[i + 2:i + 3].isalpha():
+        # Embedded options (e.g. `(?x)` ignores whitespace) change how the rest is read
+        close = value.find(')', i)
+        if close == -1:
+            raise ValueError("unterminated embedded options")
+        i = close + 1
+        allow_literal = False
+
+    # One flag per open group: whether it contains an unbounded quantifier
+    groups = [False]
+    capturing_groups = 0
+    runs, current = [], []
+    # The last quantifiable item: None, 'char' (in `current`), 'atom' or 'group'
+    last_item = None
+    last_group_unbounded = False
+    nested_unbounded = False
+
+    def end_run():
+        runs.append(''.join(current))
+        current.clear()
+
+    while i < len(value):
+        char = value[i]
+        at_top_level = len(groups) == 1
+
+        if char == '\\':
+            end_run()
+            last_item = 'atom'
+            i = _escape_end(value, i, capturing_groups)
+        elif char == '[':
+            allow_literal = False
+            end_run()
+            last_item = 'atom'
+            i = _bracket_expression_end(value, i)
+        elif char == '(':
+            end_run()
+            groups.append(False)
+            last_item = None
+            prefix_length = _group_prefix_length(value, i)
+            if prefix_length == 1:
+                capturing_groups += 1
+            i += prefix_length
+        elif char == ')':
+            if at_top_level:
+                raise ValueError("unbalanced parenthesis")
+            last_group_unbounded = groups.pop()
+            groups[-1] = groups[-1] or last_group_unbounded
+            last_item = 'group'
+            i += 1
+        elif char == '|':
+            if at_top_level:
+                allow_literal = False
+            end_run()
+            last_item = None
+            i += 1
+        elif char in '*+?' or (char == '{' and value[i + 1:i + 2].isdigit()):
+            if char == '{':
+                bound = _BOUND_RE.match(value, i)
+                if not bound:
+                    raise ValueError("unterminated bound")
+                minimum, maximum = bound.group(1), bound.group(3)
+                if int(minimum) > _MAX_BOUND or int(maximum or 0) > _MAX_BOUND:
+                    raise ValueError(f"repetition counts are limited to {_MAX_BOUND}")
+                if maximum and int(minimum) > int(maximum):
+                    raise ValueError("invalid bound, minimum above maximum")
+                unbounded = maximum == ''
+                length = bound.end() - i
+            else:
+                unbounded = char in '*+'
+                length = 1
+            if value.startswith('?', i + length):  # Non-greedy variant
+                length += 1
+
+            if last_item is None:
+                raise ValueError("quantifier without operand")
+            if last_item == 'char' and at_top_level:
+                # The quantified character may not be part of the match
+                current.pop()
+            if unbounded:
+                if last_item == 'group' and last_group_unbounded:
+                    nested_unbounded = True
+                groups[-1] = True
+            end_run()
+            last_item = None
+            i += length
+        elif char in '.^$':
+            end_run()
+            last_item = 'atom' if char == '.' else None
+            i += 1
+        else:
+            if at_top_level:
+                current.append(char)
+            last_item = 'char'
+            i += 1
+
+    if len(groups) > 1:
+        raise ValueError("unbalanced parenthesis")
+    end_run()
+
+    longest = max(runs, key=len)
+    if not allow_literal or len(longest) < _MIN_PREFILTER_LITERAL_LENGTH:
+        longest = None
+    return _RegexSummary(longest, nested_unbounded)
+
+
+def validate_description_regex(value):
+    """Reject overly long or malformed regexes and patterns prone to catastrophic backtracking."""
+    if len(value) > MAX_DESCRIPTION_REGEX_LENGTH:
+        raise ValidationError(f"Regular expressions are limited to {MAX_DESCRIPTION_REGEX_LENGTH} characters.")
+
+    try:
+        summary = _summarize_regex(value)
+    except ValueError as e:
+        raise ValidationError(f"Invalid regular expression: {e}")
+
+    if summary.has_nested_unbounded_repeat:
+        raise ValidationError("Nested unbounded quantifiers (e.g. `(a+)+`) are not allowed.")
+
 
 class DescriptionFilter(rest_framework.FilterSet):
     """FilterSet for filtering tasks based on their description and completion status."""
@@ -31,47 +277,95 @@ class DescriptionFilter(rest_framework.FilterSet):
     )
     description__regex = rest_framework.CharFilter(
         field_name='description',
-        lookup_expr='iregex',
+        method='filter_description_regex',
+        validators=[validate_description_regex],
         help_text="Filter tasks where the description matches the specified regex pattern (case-insensitive)."
     )
 
+    description__search = rest_framework.CharFilter(
+        field_name='search_vector',
+        method='filter_description_search',
+        help_text="Full-text search over the task description (English stemming, e.g. 'meeting' matches 'meetings')."
+    )
+
     class Meta:
         model = Task
         fields = ['description', 'completed']
 
+    def filter_description_regex(self, queryset, name, value) -> QuerySet:
+        """
+        Filter tasks whose description matches the regex.
+
+        The longest literal the pattern requires is applied first as an `icontains`
+        filter, so the trigram index can narrow down the rows the regex is run against.
+        Patterns without any regex metacharacters only need that `icontains` filter.
+        """
+        if not _REGEX_METACHARACTERS.intersection(value):
+            return queryset.filter(**{f'{name}__icontains': value})
+
+        literal = _summarize_regex(value).required_literal
+        if literal:
+            queryset = queryset.filter(**{f'{name}__icontains': literal})
+
+        return queryset.filter(**{f'{name}__iregex': value})
+
+    def filter_description_search(self, queryset, name, value) -> QuerySet:
+        """Full-text search on the description, falling back to `icontains` outside PostgreSQL."""
+
+        if connections[queryset.db].vendor != 'postgresql':
+            # The search vector is only maintained by the PostgreSQL trigger
+            return queryset.filter(description__icontains=value)
+
+        return queryset.filter(**{name: SearchQuery(value, config='english')})
+
 
 class DateFilter(rest_framework.FilterSet):
     """FilterSet for filtering tasks by their creation time."""
 
+    # All date filters compare `creation_time` against timezone-aware bounds instead of
+    # using `creation_time__date`, so the database can use the `creation_time` indexes.
     created_after = rest_framework.DateFilter(
-        field_name='creation_time__date',
-        lookup_expr='gte',
+        field_name='creation_time',
+        method='filter_created_after',
         help_text="Filter tasks created on or after the specified date (YYYY-MM-DD)."
     )
     created_before = rest_framework.DateFilter(
-        field_name='creation_time__date',
-        lookup_expr='lte',
+        field_name='creation_time',
+        method='filter_created_before',
         help_text="Filter tasks created on or before the specified date (YYYY-MM-DD)."
     )
     created_on = rest_framework.DateFilter(
-        field_name='creation_time__date',
+        field_name='creation_time',
         method='filter_created_on',
         help_text="Filter tasks created on the exact specified date (YYYY-MM-DD). This includes the full day."
     )
 
+    def filter_created_after(self, queryset, name, value) -> QuerySet:
+        """Filter tasks created from the start of the given date onwards."""
+
+        start_of_day, _ = self._get_day_range(value)
+        return queryset.filter(**{f'{name}__gte': start_of_day})
+
+    def filter_created_before(self, queryset, name, value) -> QuerySet:
+        """Filter tasks created up to the end of the given date."""
+
+        _, end_of_day = self._get_day_range(value)
+        return queryset.filter(**{f'{name}__lte': end_of_day})
+
     def filter_created_on(self, queryset, name, value) -> QuerySet:
         """Filter tasks created within the full day of the given date."""
 
         start_of_day, end_of_day = self._get_day_range(value)
-        return queryset.filter(creation_time__range=(start_of_day, end_of_day))
+        return queryset.filter(**{f'{name}__range': (start_of_day, end_of_day)})
 
     @staticmethod
     def _get_day_range(date_value) -> Tuple[datetime, datetime]:
         """Get the timezone-aware start and end of the day for the given date."""
 
+        # zoneinfo timezones can be attached directly, which is all `make_aware` would do
         tz = timezone.get_current_timezone()
-        start_of_day = timezone.make_aware(datetime.combine(date_value, time.min), tz)
-        end_of_day = timezone.make_aware(datetime.combine(date_value, time.max), tz)
+        start_of_day = datetime.combine(date_value, time.min, tzinfo=tz)
+        end_of_day = datetime.combine(date_value, time.max, tzinfo=tz)
         return start_of_day, end_of_day
 
     class Meta:
@@ -84,30 +378,22 @@ class TaskFilter(DescriptionFilter, DateFilter):
         model = Task
         fields = [
             'description', 'description__contains', 'description__startswith', 'description__regex',
+            'description__search',
             'created_after', 'created_before', 'created_on', 'completed'
         ]
 
+    _FIELD_SET = frozenset(Meta.fields)
+
     def __init__(self, data=None, queryset=None, *, request=None, prefix=None):
         """Initialize the TaskFilter with the request to enable logging."""
 
         super().__init__(data, queryset, request=request, prefix=prefix)
         self.request = request
 
-        if request and data:
-            user_id = getattr(request.user, 'id', 'anonymous')
-            applied_filters = [k for k in data.keys() if k in self.Meta.fields]
+        if not (request and data) or not logger.isEnabledFor(logging.INFO):
+            return
 
-            if applied_filters:
-                logger.info(f"User {user_id} applied filters: {', '.join(applied_filters)}")
-
-    def filter_queryset(self, queryset):
-        filtered_queryset = super().filter_queryset(queryset)
-
-        if hasattr(self, 'request') and self.request and self.data:
-            user_id = getattr(self.request.user, 'id', 'anonymous')
-            original_count = queryset.count()
-            filtered_count = filtered_queryset.count()
-
-            logger.info(f"Filter results for user {user_id}: {filtered_count} tasks (from {original_count})")
-
-        return filtered_queryset
\ No newline at end of file
+        applied_filters = data.keys() & self._FIELD_SET
+        if applied_filters:
+            user_id = getattr(request.user, 'id', 'anonymous')
+            logger.info("User %s applied filters: %s", user_id, ', '.join(sorted(applied_filters)))
@@ -0,0 +1,22 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+from task_tracker.operations import PostgresAddIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0002_task_desc_trgm"),
+    ]
+
+    operations = [
+        PostgresAddIndex(
+            model_name="task",
+            index=django.contrib.postgres.indexes.HashIndex(
+                django.db.models.functions.text.Upper("description"),
+                name="task_desc_upper_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from task_tracker.operations import PostgresAddIndex, PostgresRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0003_task_desc_upper_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text search vector of the description, maintained by a database trigger (PostgreSQL only)",
+                null=True,
+            ),
+        ),
+        PostgresAddIndex(
+            model_name="task",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="task_search_vector_idx"
+            ),
+        ),
+        PostgresRunSQL(
+            sql=[
+                """
+                CREATE TRIGGER task_search_vector_update
+                BEFORE INSERT OR UPDATE OF description ON tasks_task
+                FOR EACH ROW EXECUTE FUNCTION
+                tsvector_update_trigger(search_vector, 'pg_catalog.english', description);
+                """,
+                "UPDATE tasks_task SET search_vector = to_tsvector('pg_catalog.english', description);",
+            ],
+            reverse_sql="DROP TRIGGER IF EXISTS task_search_vector_update ON tasks_task;",
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-15 21:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0004_task_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["user", "-creation_time"], name="task_user_ctime_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0006_task_desc_nonempty"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_user_ctime_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["user", "-creation_time", "-id"], name="task_user_ctime_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_task_user_ctime_id_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["user", "completed", "-creation_time", "-id"],
+                name="task_user_done_ctime_idx",
+            ),
+        ),
+    ]
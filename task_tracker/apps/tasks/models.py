@@ -1,5 +1,43 @@
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth.models import User
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Concat, Length, Substr, Upper
+from django.db.models.lookups import GreaterThan
+from django.contrib.postgres.indexes import GinIndex, HashIndex
+from django.contrib.postgres.search import SearchVectorField
+
+DESCRIPTION_PREVIEW_LENGTH = 50
+
+
+class TaskQuerySet(models.QuerySet):
+    """QuerySet with helpers shared by the task API views."""
+
+    def with_short_description(self):
+        """
+        Annotate `short_description`: the description truncated the same way `Task.__str__` does it.
+
+        The truncation runs in the database, so only the preview is transferred for long descriptions.
+        """
+        return self.annotate(
+            short_description=Case(
+                When(
+                    GreaterThan(Length('description'), DESCRIPTION_PREVIEW_LENGTH),
+                    then=Concat(Substr('description', 1, DESCRIPTION_PREVIEW_LENGTH), Value('...')),
+                ),
+                default=F('description'),
+                output_field=models.TextField(),
+            )
+        )
+
+    def toggle_completion(self):
+        """
+        Flip `completed` (and bump `updated_at`) of every task in the queryset with a single UPDATE.
+
+        The new value is computed by the database, so concurrent toggles can't overwrite each other.
+        Returns the number of toggled tasks.
+        """
+        return self.update(completed=~F('completed'), updated_at=timezone.now())
 
 
 class Task(models.Model):
@@ -8,6 +46,9 @@ class Task(models.Model):
 
     Each task is owned by a user and can only be viewed by its owner.
     Tasks track creation time, completion status, and description.
+
+    For partial updates prefer `save(update_fields=[..., 'updated_at'])` (or a queryset
+    `update()`), so a potentially long `description` isn't rewritten on every save.
     """
     user = models.ForeignKey(
         User,
@@ -37,15 +78,51 @@ class Task(models.Model):
         help_text='When the task was last updated'
     )
 
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text='Full-text search vector of the description, maintained by a database trigger (PostgreSQL only)'
+    )
+
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         ordering = ['-creation_time']  # Newest tasks first
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
+        # PostgreSQL-only indexes are created through `PostgresAddIndex` in the
+        # migrations, so they are skipped on SQLite (e.g. local test runs).
+        indexes = [
+            # Trigram index backing the `description` icontains/istartswith/iregex filters. The
+            # i-lookups compile to `description ILIKE ...` (see `task_tracker.lookups`) so it applies.
+            GinIndex(fields=['description'], name='task_desc_trgm', opclasses=['gin_trgm_ops']),
+            # `iexact` compiles to `UPPER(description) = UPPER(%s)` on PostgreSQL. A hash index
+            # is used instead of a btree so long descriptions don't hit the btree row size limit.
+            HashIndex(Upper('description'), name='task_desc_upper_idx'),
+            GinIndex(fields=['search_vector'], name='task_search_vector_idx'),
+            # Matches the default list query: `WHERE user_id = ? ORDER BY creation_time DESC, id DESC`
+            models.Index(fields=['user', '-creation_time', '-id'], name='task_user_ctime_id_idx'),
+            # Same, narrowed by the `completed` filter. Date range filters seek on `creation_time`
+            # through either index (btree indexes are scanned in both directions)
+            models.Index(fields=['user', 'completed', '-creation_time', '-id'], name='task_user_done_ctime_idx'),
+        ]
+        constraints = [
+            # `blank=False` is only enforced by forms/serializers; reject empty descriptions in the database too
+            models.CheckConstraint(condition=~models.Q(description=''), name='task_desc_nonempty'),
+        ]
 
     def __str__(self):
-        return f"{(self.description[:50])}{'...' if len(self.description) > 50 else ''}"
+        description = self.description
+        if len(description) <= DESCRIPTION_PREVIEW_LENGTH:
+            return description
+        return description[:DESCRIPTION_PREVIEW_LENGTH] + '...'
 
     def toggle_completion(self):
-        """Toggles the completion status of the task"""
-        self.completed = not self.completed
-        self.save()
\ No newline at end of file
+        """
+        Toggles the completion status of the task.
+
+        The flip is done by a single UPDATE of `completed` and `updated_at`, so the description
+        isn't rewritten and concurrent toggles can't overwrite each other.
+        """
+        Task.objects.filter(pk=self.pk).toggle_completion()
+        self.refresh_from_db(fields=['completed', 'updated_at'])
\ No newline at end of file
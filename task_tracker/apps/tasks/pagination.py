@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the task list.
+
+    Pages are fetched by seeking on the ordering column instead of using OFFSET, and no
+    COUNT(*) is issued, so every page costs the same no matter how many tasks a user has.
+    """
+    # `id` breaks ties between tasks created in the same instant (e.g. bulk inserts)
+    ordering = ('-creation_time', '-id')
@@ -6,9 +6,10 @@ class ListTasksSerializer(serializers.ModelSerializer):
     """
     Serializer for listing tasks.
 
-    This serializer provides a shortened version of the task's `description`
-    (via the model's `__str__` method). Use it when only a brief summary of
-    tasks is required, such as in listings.
+    This serializer provides a shortened version of the task's `description`,
+    read from the `short_description` annotation of `Task.objects.with_short_description()`
+    (or the model's `__str__` method for plain instances). Use it when only a brief
+    summary of tasks is required, such as in listings.
     """
     description = serializers.SerializerMethodField(
         help_text="A shortened version of the task's description."
@@ -30,7 +31,15 @@ class ListTasksSerializer(serializers.ModelSerializer):
         }
 
     def get_description(self, instance: Task) -> str:
-        """Returns a shortened version of the task's description by using the model's `__str__` method."""
+        """
+        Returns a shortened version of the task's description.
+
+        Querysets built with `Task.objects.with_short_description()` already carry the
+        truncated text computed by the database; otherwise the model's `__str__` method is used.
+        """
+        short_description = getattr(instance, 'short_description', None)
+        if short_description is not None:
+            return short_description
         return str(instance)  # The __str__ method of the Task model
 
 
@@ -62,4 +71,16 @@ class TaskSerializer(serializers.ModelSerializer):
             'updated_at': {
                 'help_text': "The timestamp when the task was last updated (read-only)."
             },
-        }
\ No newline at end of file
+        }
+
+    def update(self, instance: Task, validated_data: dict) -> Task:
+        """
+        Updates only the fields present in the request.
+
+        Saving with `update_fields` keeps the UPDATE limited to the changed columns
+        (plus `updated_at`) instead of rewriting the whole row.
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
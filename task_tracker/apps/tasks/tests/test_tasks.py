@@ -1,6 +1,12 @@
+from datetime import timedelta
+
+from django.db.models import TextField
+from django.utils import timezone
+
 from task_tracker.test import TestCase
 from task_tracker.apps.tasks.factories import TaskFactory, UserFactory
 from task_tracker.apps.tasks.models import Task
+from task_tracker.lookups import ILikeIContains, ILikeIStartsWith
 
 
 class TestTaskModel(TestCase):
@@ -18,8 +24,8 @@ class TestTaskModel(TestCase):
             completed=True,
         )
 
-        tasks = Task.objects.filter(user=self.user).order_by('id')
-        self.assertEqual(tasks.count(), 2)
+        tasks = list(Task.objects.filter(user=self.user).order_by('id'))
+        self.assertEqual(len(tasks), 2)
 
         self.assertEqual(tasks[0], incomplete_task)
         self.assertEqual(tasks[0].description, "Incomplete task")
@@ -36,10 +42,13 @@ class TestTaskModel(TestCase):
         self_task = TaskFactory(user=self.user)
         other_task = TaskFactory(user=other_user)
 
-        self.assertIn(self_task, Task.objects.filter(user=self.user))
-        self.assertNotIn(other_task, Task.objects.filter(user=self.user))
-        self.assertIn(other_task, Task.objects.filter(user=other_user))
-        self.assertNotIn(self_task, Task.objects.filter(user=other_user))
+        user_tasks = list(Task.objects.filter(user=self.user))
+        other_user_tasks = list(Task.objects.filter(user=other_user))
+
+        self.assertIn(self_task, user_tasks)
+        self.assertNotIn(other_task, user_tasks)
+        self.assertIn(other_task, other_user_tasks)
+        self.assertNotIn(self_task, other_user_tasks)
 
     def test_task_str_representation(self):
         """Test string representation with various description lengths."""
@@ -70,6 +79,12 @@ class TestTaskModel(TestCase):
         with self.assertRaises(IntegrityError):
             TaskFactory(user=None)
 
+    def test_task_rejects_empty_description(self):
+        """Test the database rejects tasks with an empty description."""
+        from django.db import IntegrityError
+        with self.assertRaises(IntegrityError):
+            TaskFactory(user=self.user, description='')
+
     def test_task_updates(self):
         """Test updating task attributes."""
         task = TaskFactory(
@@ -88,10 +103,43 @@ class TestTaskModel(TestCase):
 
         self.assertNotEqual(refreshed_task.updated_at, refreshed_task.creation_time)
 
+    def test_toggle_completion(self):
+        """Test toggling the completion status flips it in the database."""
+        task = TaskFactory(user=self.user, completed=False)
+        previous_update = task.updated_at
+
+        task.toggle_completion()
+        self.assertTrue(task.completed)
+        self.assertTrue(Task.objects.get(id=task.id).completed)
+        self.assertGreater(task.updated_at, previous_update)
+
+        task.toggle_completion()
+        self.assertFalse(task.completed)
+        self.assertFalse(Task.objects.get(id=task.id).completed)
+
+    def test_factory_bulk_batch(self):
+        """Test TaskFactory.create_batch_bulk persists the batch and applies timestamp overrides."""
+        creation_time = timezone.now() - timedelta(days=3)
+
+        tasks = TaskFactory.create_batch_bulk(3, user=self.user, creation_time=creation_time)
+
+        self.assertEqual(len(tasks), 3)
+        stored_tasks = Task.objects.filter(user=self.user)
+        self.assertEqual(stored_tasks.count(), 3)
+        for task in stored_tasks:
+            self.assertEqual(task.creation_time, creation_time)
+
     def test_task_ordering(self):
         """Test default task ordering is by creation time (newest first)."""
         first_task = TaskFactory(user=self.user, description="First created")
         second_task = TaskFactory(user=self.user, description="Second created")
 
-        tasks = Task.objects.filter(user=self.user)
-        self.assertEqual(list(tasks), [second_task, first_task])
\ No newline at end of file
+        tasks = list(Task.objects.filter(user=self.user))
+        self.assertEqual(tasks, [second_task, first_task])
+
+    def test_description_uses_ilike_lookups(self):
+        """Test the case-insensitive description lookups compile to ILIKE on PostgreSQL."""
+        description = Task._meta.get_field('description')
+        self.assertIs(description.get_lookup('icontains'), ILikeIContains)
+        self.assertIs(description.get_lookup('istartswith'), ILikeIStartsWith)
+        self.assertIsNot(TextField().get_lookup('icontains'), ILikeIContains)
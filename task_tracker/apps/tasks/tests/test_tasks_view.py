@@ -1,43 +1,81 @@
 from datetime import timedelta
 
 from task_tracker.test import TestCase
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.test import APIClient
 from django.utils import timezone
 
+from task_tracker.apps.tasks.filters import TaskFilter, _summarize_regex, validate_description_regex
 from task_tracker.apps.tasks.models import Task
 from task_tracker.apps.tasks.factories import TaskFactory, UserFactory
 
 
-class TaskViewTests(TestCase):
+class TaskViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.normal_user = UserFactory()
+        cls.other_user = UserFactory()
+        cls.list_url = reverse('task-list')
+        # One reference time for the date filter tests, `days_ago[n]` is `n` days before it
+        cls.now = timezone.now()
+        cls.days_ago = {n: cls.now - timedelta(days=n) for n in range(5)}
+
     def setUp(self):
         super().setUp()
-        self.normal_user = UserFactory()
-        self.other_user = UserFactory()
+        # `api_client` acts as the normal user; `other_client` as a user who doesn't own their tasks
+        self.api_client.force_authenticate(user=self.normal_user)
+        self.other_client = APIClient()
+        self.other_client.force_authenticate(user=self.other_user)
+
+    def _create_tasks_at(self, rows):
+        """
+        Create the normal user's tasks from `(description, creation_time)` pairs with two queries.
+
+        `bulk_create` fills in `creation_time` (`auto_now_add`), so the wanted times are
+        written back afterwards with a single `bulk_update`.
+        """
+        tasks = Task.objects.bulk_create([Task(user=self.normal_user, description=d) for d, _ in rows])
+        for task, (_, creation_time) in zip(tasks, rows):
+            task.creation_time = creation_time
+        Task.objects.bulk_update(tasks, ['creation_time'])
+        return tasks
+
+    def _list_tasks(self, data=None, ordering=None):
+        """GET the task list, asserting it takes a single query whatever the filters, ordering or page size."""
+        if ordering:
+            data = {**(data or {}), 'ordering': ordering}
+        with self.assertNumQueries(1):
+            return self.api_client.get(self.list_url, data)
+
+
+class TaskViewTests(TaskViewTestCase):
 
     def test_user_can_create_task(self):
         """Test an user can create a task"""
-        TaskFactory(user=self.normal_user)
-
-        self.api_client.force_authenticate(user=self.normal_user)
         data = {
             'description': 'This is a new task description',
             'completed': False
         }
 
-        response = self.api_client.post(reverse('task-create'), data, format='json')
+        response = self.api_client.post(self.list_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Task.objects.count(), 2)
-        self.assertEqual(Task.objects.last().user, self.normal_user)
+        # Created tasks are returned with the full TaskSerializer, not the list preview
+        self.assertEqual(response.data['description'], data['description'])
+        self.assertEqual(Task.objects.count(), 1)
+        self.assertEqual(Task.objects.get().user, self.normal_user)
 
     def test_api_throws_errors_on_bad_requests(self):
         """Test the API throws errors on bad create/update/delete requests"""
-        self.api_client.force_authenticate(user=self.normal_user)
         task = TaskFactory(user=self.normal_user, description="Test task description")
 
         # Bad create
         data = {'description': ''}
-        response = self.api_client.post(reverse('task-create'), data, format='json')
+        response = self.api_client.post(self.list_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.data)
 
         # Bad update
@@ -49,12 +87,65 @@ class TaskViewTests(TestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_retrieve_task_uses_a_single_query(self):
+        """Test retrieving a task is a single query that neither joins the owner nor loads the search vector"""
+        task = TaskFactory(user=self.normal_user, minimal=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.get(reverse('task-detail', kwargs={'pk': task.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], task.id)
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]['sql']
+        self.assertNotIn('auth_user', sql)
+        self.assertNotIn('search_vector', sql)
+
+    def test_update_and_delete_fetch_the_task_once(self):
+        """Test updating or deleting a task looks it up a single time"""
+        task = TaskFactory(user=self.normal_user, minimal=True)
+
+        # SELECT + UPDATE
+        with self.assertNumQueries(2):
+            response = self.api_client.patch(
+                reverse('task-update-description', kwargs={'pk': task.id}),
+                {'description': 'Updated description'},
+                format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # SELECT + DELETE
+        with self.assertNumQueries(2):
+            response = self.api_client.delete(reverse('task-delete', kwargs={'pk': task.id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_toggle_completion(self):
+        """Test toggling a task flips its status with one UPDATE and one SELECT"""
+        task = TaskFactory(user=self.normal_user, minimal=True, completed=False)
+        url = reverse('task-toggle-complete', kwargs={'pk': task.id})
+
+        with self.assertNumQueries(2):
+            response = self.api_client.patch(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['completed'])
+
+        response = self.api_client.patch(url)
+        self.assertFalse(response.data['completed'])
+        self.assertFalse(Task.objects.get(id=task.id).completed)
+
+    def test_user_cannot_toggle_task_they_dont_own(self):
+        """Test a user that does not own a task cannot toggle it"""
+        task = TaskFactory(user=self.normal_user, minimal=True, completed=False)
+
+        response = self.other_client.patch(reverse('task-toggle-complete', kwargs={'pk': task.id}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Task.objects.get(id=task.id).completed)
+
     def test_user_cannot_see_task_they_dont_own(self):
         """Test a user that does not own a task cannot see it"""
-        task = TaskFactory(user=self.normal_user)
+        task = TaskFactory(user=self.normal_user, minimal=True)
 
-        self.api_client.force_authenticate(user=self.other_user)
-        response = self.api_client.get(
+        response = self.other_client.get(
             reverse('task-detail', kwargs={'pk': task.id}),
             format='json'
         )
@@ -64,9 +155,8 @@ class TaskViewTests(TestCase):
         """Test a user that does not own a task cannot update it"""
         task = TaskFactory(user=self.normal_user, description="Some description")
 
-        self.api_client.force_authenticate(user=self.other_user)
         data = {'description': 'Updated description'}
-        response = self.api_client.patch(
+        response = self.other_client.patch(
             reverse('task-update-description', kwargs={'pk': task.id}),
             data,
             format='json'
@@ -75,10 +165,9 @@ class TaskViewTests(TestCase):
 
     def test_user_cannot_delete_task_they_dont_own(self):
         """Test a user that does not own a task cannot delete it"""
-        task = TaskFactory(user=self.normal_user)
+        task = TaskFactory(user=self.normal_user, minimal=True)
 
-        self.api_client.force_authenticate(user=self.other_user)
-        response = self.api_client.delete(
+        response = self.other_client.delete(
             reverse('task-delete', kwargs={'pk': task.id}),
             format='json'
         )
@@ -87,206 +176,173 @@ class TaskViewTests(TestCase):
     def test_list_all_tasks(self):
         """Test listing all tasks for the authenticated user"""
         # Create multiple tasks for the user
-        TaskFactory.create_batch(5, user=self.normal_user)
-        TaskFactory.create_batch(3, user=self.other_user)  # Other user's tasks
+        TaskFactory.create_batch_bulk(5, user=self.normal_user, minimal=True)
+        TaskFactory.create_batch_bulk(3, user=self.other_user, minimal=True)  # Other user's tasks
 
-        self.api_client.force_authenticate(user=self.normal_user)
-        response = self.api_client.get(reverse('task-list'))
+        response = self._list_tasks()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should see only their own tasks (5 + 1 from setUp)
+        # Should see only their own tasks
         self.assertEqual(len(response.data['results']), 5)
 
     def test_list_view_is_paginated(self):
         """Test the list view is paginated"""
-        TaskFactory.create_batch(15, user=self.normal_user)  # Create 15 more tasks
+        TaskFactory.create_batch_bulk(15, user=self.normal_user, minimal=True)  # Create 15 more tasks
 
-        self.api_client.force_authenticate(user=self.normal_user)
-        response = self.api_client.get(reverse('task-list'))
+        response = self._list_tasks()
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('count', response.data)
+        self.assertNotIn('count', response.data)
         self.assertIn('next', response.data)
         self.assertIn('previous', response.data)
         self.assertIn('results', response.data)
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertIsNotNone(response.data['next'])
 
-    def test_description_is_truncated_in_list(self):
-        """Test description is truncated to 50 chars in list view"""
-        long_description = "This is a very long description that should be truncated in the list view. It's definitely longer than 50 characters."
-        task = TaskFactory(user=self.normal_user, description=long_description)
-
-        self.api_client.force_authenticate(user=self.normal_user)
-        response = self.api_client.get(reverse('task-list'))
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    def test_list_view_cursor_walks_all_tasks(self):
+        """Test following the `next` cursor returns every task exactly once, newest first"""
+        tasks = TaskFactory.create_batch_bulk(15, user=self.normal_user, minimal=True)
 
-        # Find the task in the response
-        task_in_response = next(
-            (item for item in response.data['results'] if item['id'] == task.id),
-            None
-        )
+        first_page = self._list_tasks()
+        self.assertIsNone(first_page.data['previous'])
 
-        self.assertIsNotNone(task_in_response)
-        self.assertEqual(len(task_in_response['description']), 53)
-        self.assertTrue(task_in_response['description'].endswith('...'))
-
-    def test_filter_by_exact_description(self):
-        """Test filtering tasks by exact description match."""
-        task1 = TaskFactory(user=self.normal_user, description="Buy groceries")
-        task2 = TaskFactory(user=self.normal_user, description="Buy new laptop")
-        task3 = TaskFactory(user=self.normal_user, description="Call plumber")
+        with self.assertNumQueries(1):
+            second_page = self.api_client.get(first_page.data['next'])
 
-        self.api_client.force_authenticate(user=self.normal_user)
+        self.assertEqual(second_page.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(second_page.data['results']), 5)
+        self.assertIsNone(second_page.data['next'])
+        self.assertIsNotNone(second_page.data['previous'])
 
-        response = self.api_client.get(reverse('task-list') + '?description=Buy groceries')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['id'], task1.id)
+        listed = first_page.data['results'] + second_page.data['results']
+        self.assertCountEqual([item['id'] for item in listed], [task.id for task in tasks])
+        creation_times = [item['creation_time'] for item in listed]
+        self.assertEqual(creation_times, sorted(creation_times, reverse=True))
 
-        response = self.api_client.get(reverse('task-list') + '?description=buy groceries')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['id'], task1.id)
+    def test_list_view_cursor_walks_tasks_by_updated_at(self):
+        """Test ordering by `updated_at` still takes a single query per page"""
+        tasks = TaskFactory.create_batch_bulk(15, user=self.normal_user, minimal=True)
 
-        response = self.api_client.get(reverse('task-list') + '?description=Nonexistent task')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 0)
+        first_page = self._list_tasks(ordering='updated_at')
+        self.assertEqual(first_page.status_code, status.HTTP_200_OK)
 
-    def test_filter_by_description_contains(self):
-        """Test filtering tasks where description contains a substring."""
-        task1 = TaskFactory(user=self.normal_user, description="Buy groceries")
-        task2 = TaskFactory(user=self.normal_user, description="Buy new laptop")
-        task3 = TaskFactory(user=self.normal_user, description="Call plumber")
-        task4 = TaskFactory(user=self.normal_user, description="groceries shopping list")
+        with self.assertNumQueries(1):
+            second_page = self.api_client.get(first_page.data['next'])
 
-        self.api_client.force_authenticate(user=self.normal_user)
+        listed = first_page.data['results'] + second_page.data['results']
+        self.assertCountEqual([item['id'] for item in listed], [task.id for task in tasks])
 
-        response = self.api_client.get(reverse('task-list') + '?description__contains=groceries')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)
-        result_ids = [item['id'] for item in response.data['results']]
-        self.assertIn(task1.id, result_ids)
-        self.assertIn(task4.id, result_ids)
+    def test_list_query_only_selects_listed_columns(self):
+        """Test the list query neither joins the owner nor loads the other task columns"""
+        TaskFactory(user=self.normal_user, minimal=True)
 
-        response = self.api_client.get(reverse('task-list') + '?description__contains=GROCERIES')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.get(self.list_url)
 
-        response = self.api_client.get(reverse('task-list') + '?description__contains=Buy')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)
-        result_ids = [item['id'] for item in response.data['results']]
-        self.assertIn(task1.id, result_ids)
-        self.assertIn(task2.id, result_ids)
+        sql = queries[0]['sql']
+        self.assertNotIn('auth_user', sql)
+        selected_columns = sql.split(' FROM ')[0]
+        for column in ('user_id', 'search_vector'):
+            self.assertNotIn(f'"tasks_task"."{column}"', selected_columns)
 
-    def test_filter_by_description_startswith(self):
-        """Test filtering tasks where description starts with a specific prefix."""
-        task1 = TaskFactory(user=self.normal_user, description="Buy groceries")
-        task2 = TaskFactory(user=self.normal_user, description="Buy new laptop")
-        task3 = TaskFactory(user=self.normal_user, description="Call plumber")
-        task4 = TaskFactory(user=self.normal_user, description="buy medicine")  # Lowercase "buy"
-
-        self.api_client.force_authenticate(user=self.normal_user)
-
-        response = self.api_client.get(reverse('task-list') + '?description__startswith=Buy')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 3)  # Should match all 3 tasks starting with "Buy"/"buy"
+    def test_description_is_truncated_in_list(self):
+        """Test description is truncated to 50 chars in list view"""
+        long_description = "This is a very long description that should be truncated in the list view. It's definitely longer than 50 characters."
+        task = TaskFactory(user=self.normal_user, description=long_description)
 
-        response = self.api_client.get(reverse('task-list') + '?description__startswith=buy')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 3)
+        response = self._list_tasks()
 
-        response = self.api_client.get(reverse('task-list') + '?description__startswith=Call')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 1)
-        self.assertEqual(response.data['results'][0]['id'], task3.id)
 
-    def test_filter_by_description_regex(self):
-        """Test filtering tasks where description matches a regex pattern."""
-        task1 = TaskFactory(user=self.normal_user, description="Buy groceries")
-        task2 = TaskFactory(user=self.normal_user, description="Buy new laptop")
-        task3 = TaskFactory(user=self.normal_user, description="Call plumber")
-        task4 = TaskFactory(user=self.normal_user, description="Email the client")
-        task5 = TaskFactory(user=self.normal_user, description="Read book")
+        # Find the task in the response
+        task_in_response = next(
+            (item for item in response.data['results'] if item['id'] == task.id),
+            None
+        )
 
-        self.api_client.force_authenticate(user=self.normal_user)
+        self.assertIsNotNone(task_in_response)
+        self.assertEqual(len(task_in_response['description']), 53)
+        self.assertTrue(task_in_response['description'].endswith('...'))
 
-        response = self.api_client.get(reverse('task-list') + '?description__regex=er$')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 1, response.data)
-        self.assertEqual(response.data['results'][0]['id'], task3.id)
+    def test_description_truncation_boundary_in_list(self):
+        """Test the list truncates descriptions longer than 50 chars only, like Task.__str__"""
+        exact_task = TaskFactory(user=self.normal_user, description="X" * 50)
+        longer_task = TaskFactory(user=self.normal_user, description="Y" * 51)
 
-        response = self.api_client.get(reverse('task-list') + '?description__regex=^(Buy|Call)')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 3)
-        result_ids = [item['id'] for item in response.data['results']]
-        self.assertIn(task1.id, result_ids)
-        self.assertIn(task2.id, result_ids)
-        self.assertIn(task3.id, result_ids)
+        response = self._list_tasks()
 
-        response = self.api_client.get(reverse('task-list') + '?description__regex=^buy')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)
+        descriptions = {item['id']: item['description'] for item in response.data['results']}
+        self.assertEqual(descriptions[exact_task.id], "X" * 50)
+        self.assertEqual(descriptions[longer_task.id], "Y" * 50 + '...')
+        self.assertEqual(descriptions[longer_task.id], str(longer_task))
 
-    def test_combined_description_and_completion_filters(self):
-        """Test combining description filters with completion status."""
-        task1 = TaskFactory(user=self.normal_user, description="Buy groceries", completed=True)
-        task2 = TaskFactory(user=self.normal_user, description="Buy new laptop", completed=False)
-        task3 = TaskFactory(user=self.normal_user, description="Call plumber", completed=True)
-        task4 = TaskFactory(user=self.normal_user, description="buy medicine", completed=False)
+    def test_filter_by_description_regex_rejects_catastrophic_patterns(self):
+        """Test the regex filter rejects patterns with nested unbounded quantifiers."""
+        TaskFactory(user=self.normal_user, description="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaa!")
 
-        self.api_client.force_authenticate(user=self.normal_user)
-
-        response = self.api_client.get(reverse('task-list') + '?description__contains=Buy&completed=true')
+        response = self.api_client.get(self.list_url, {'description__regex': '^(a+)+$'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('description__regex', response.data)
+
+    def test_filter_by_description_regex_rejects_invalid_or_long_patterns(self):
+        """Test the regex filter rejects patterns that don't compile or exceed the length limit."""
+        invalid_patterns = ['(unclosed', r'\q', 'a{2,1}', 'a{1', 'x{300}', '[z-a]', r'\1(a)', 'a' * 201]
+        for pattern in invalid_patterns:
+            with self.subTest(pattern=pattern[:20]):
+                response = self.api_client.get(self.list_url, {'description__regex': pattern})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('description__regex', response.data)
+
+    def test_description_regex_uses_postgresql_syntax(self):
+        """Test the regex analysis follows PostgreSQL's syntax rather than Python's."""
+        # POSIX classes and bracket expressions: no literal prefilter is taken from them
+        self.assertIsNone(_summarize_regex('[[:alpha:]]abc').required_literal)
+        self.assertIsNone(_summarize_regex('x[]abc]yz').required_literal)
+        # Word boundary escapes are valid PostgreSQL and only delimit the literal
+        validate_description_regex(r'\mfoo\M')
+        self.assertEqual(_summarize_regex(r'\mfoo\M').required_literal, 'foo')
+        self.assertEqual(_summarize_regex(r'\yinvoice\d+').required_literal, 'invoice')
+        # Bounds up to 255, back references and character entry escapes
+        validate_description_regex(r'(a)\1{0,255}\x41\u00e9')
+
+        filterset = TaskFilter({'description__regex': '[[:alpha:]]abc'}, queryset=Task.objects.all())
+        self.assertNotIn('LIKE', str(filterset.qs.query).upper())
+
+    def test_description_regex_rejects_nested_quantifiers_at_any_depth(self):
+        """Test nested unbounded quantifiers are found inside groups and non-capturing groups."""
+        for pattern in ['x(y(a+)+)', '((a+)b)+', '(?:ab(c*))+', '^(a+){2,}$']:
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(ValidationError):
+                    validate_description_regex(pattern)
+
+        # Bounded outer repeats can't backtrack catastrophically
+        validate_description_regex('(a+){1,5}')
+
+    def test_filter_by_description_search(self):
+        """Test full-text search over task descriptions."""
+        task1 = TaskFactory(user=self.normal_user, description="Prepare the quarterly meeting")
+        task2 = TaskFactory(user=self.normal_user, description="Call plumber")
+
+        response = self._list_tasks({'description__search': 'meeting'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['id'], task1.id)
 
-        response = self.api_client.get(reverse('task-list') + '?description__startswith=Buy&completed=false')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)
-        result_ids = [item['id'] for item in response.data['results']]
-        self.assertIn(task2.id, result_ids)
-        self.assertIn(task4.id, result_ids)
-
-        response = self.api_client.get(reverse('task-list') + '?description__regex=^(Buy|Call)&completed=true')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)
-        result_ids = [item['id'] for item in response.data['results']]
-        self.assertIn(task1.id, result_ids)
-        self.assertIn(task3.id, result_ids)
-
     def test_filter_by_created_after(self):
         """Test filtering tasks by creation time after a specific date."""
-        base = timezone.now()
-
-        yesterday = base - timedelta(days=1)
-        two_days_ago = base - timedelta(days=2)
-        three_days_ago = base - timedelta(days=3)
-
-        TaskFactory(
-            description="Recent task",
-            user=self.normal_user,
-            creation_time=yesterday
-        )
-        TaskFactory(
-            description="Older task",
-            user=self.normal_user,
-            creation_time=two_days_ago
-        )
-        TaskFactory(
-            description="Oldest task",
-            user=self.normal_user,
-            creation_time=three_days_ago
-        )
-
-        self.api_client.force_authenticate(user=self.normal_user)
+        self._create_tasks_at([
+            ("Recent task", self.days_ago[1]),
+            ("Older task", self.days_ago[2]),
+            ("Oldest task", self.days_ago[3]),
+        ])
 
-        filter_date = (base - timedelta(days=2)).date().isoformat()
-        response = self.api_client.get(reverse('task-list') + f"?created_after={filter_date}")
+        filter_date = self.days_ago[2].date().isoformat()
+        response = self._list_tasks({'created_after': filter_date})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(response.data["results"]), 2)
         descriptions = [task["description"] for task in response.data["results"]]
         self.assertIn("Recent task", descriptions)
         self.assertIn("Older task", descriptions)
@@ -294,34 +350,17 @@ class TaskViewTests(TestCase):
 
     def test_filter_by_created_before(self):
         """Test filtering tasks by creation time before a specific date."""
-        base = timezone.now()
-
-        yesterday = base - timedelta(days=1)
-        two_days_ago = base - timedelta(days=2)
-        three_days_ago = base - timedelta(days=3)
+        self._create_tasks_at([
+            ("Recent task", self.days_ago[1]),
+            ("Older task", self.days_ago[2]),
+            ("Oldest task", self.days_ago[3]),
+        ])
 
-        TaskFactory(
-            description="Recent task",
-            user=self.normal_user,
-            creation_time=yesterday
-        )
-        TaskFactory(
-            description="Older task",
-            user=self.normal_user,
-            creation_time=two_days_ago
-        )
-        TaskFactory(
-            description="Oldest task",
-            user=self.normal_user,
-            creation_time=three_days_ago
-        )
-        self.api_client.force_authenticate(user=self.normal_user)
-
-        filter_date = (base - timedelta(days=2)).date().isoformat()
-        response = self.api_client.get(reverse('task-list') + f"?created_before={filter_date}")
+        filter_date = self.days_ago[2].date().isoformat()
+        response = self._list_tasks({'created_before': filter_date})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(response.data["results"]), 2)
         descriptions = [task["description"] for task in response.data["results"]]
         self.assertNotIn("Recent task", descriptions)
         self.assertIn("Older task", descriptions)
@@ -329,38 +368,18 @@ class TaskViewTests(TestCase):
 
     def test_filter_by_created_on(self):
         """Test filtering tasks created on a specific date."""
-        today = timezone.now()
-        yesterday = today - timedelta(days=1)
-        two_days_ago = today - timedelta(days=2)
-
-        TaskFactory(
-            description="Today task 1",
-            user=self.normal_user,
-            creation_time=today
-        )
-        TaskFactory(
-            description="Today task 2",
-            user=self.normal_user,
-            creation_time=today - timedelta(hours=2)
-        )
-        TaskFactory(
-            description="Yesterday task",
-            user=self.normal_user,
-            creation_time=yesterday
-        )
-        TaskFactory(
-            description="Two days ago task",
-            user=self.normal_user,
-            creation_time=two_days_ago
-        )
+        self._create_tasks_at([
+            ("Today task 1", self.now),
+            ("Today task 2", self.now.replace(hour=0, minute=0, second=0, microsecond=0)),  # Start of the day
+            ("Yesterday task", self.days_ago[1]),
+            ("Two days ago task", self.days_ago[2]),
+        ])
 
-        self.api_client.force_authenticate(user=self.normal_user)
-
-        filter_date = today.date().isoformat()
-        response = self.api_client.get(reverse('task-list') + f"?created_on={filter_date}")
+        filter_date = self.now.date().isoformat()
+        response = self._list_tasks({'created_on': filter_date})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["count"], 2, response.data)
+        self.assertEqual(len(response.data["results"]), 2, response.data)
         descriptions = [task["description"] for task in response.data["results"]]
         self.assertIn("Today task 1", descriptions)
         self.assertIn("Today task 2", descriptions)
@@ -369,42 +388,17 @@ class TaskViewTests(TestCase):
 
     def test_combined_date_filters(self):
         """Test using multiple date filters together."""
-        today = timezone.now()
-        yesterday = today - timedelta(days=1)
-        two_days_ago = today - timedelta(days=2)
-        three_days_ago = today - timedelta(days=3)
-        four_days_ago = today - timedelta(days=4)
-
-        TaskFactory(
-            description="Today task",
-            user=self.normal_user,
-            creation_time=today
-        )
-        TaskFactory(
-            description="Yesterday task",
-            user=self.normal_user,
-            creation_time=yesterday
-        )
-        TaskFactory(
-            description="Two days ago task",
-            user=self.normal_user,
-            creation_time=two_days_ago
-        )
-        TaskFactory(
-            description="Three days ago task",
-            user=self.normal_user,
-            creation_time=three_days_ago
-        )
-        TaskFactory(
-            description="Four days ago task",
-            user=self.normal_user,
-            creation_time=four_days_ago
-        )
-        self.api_client.force_authenticate(user=self.normal_user)
-
-        after_date = (today - timedelta(days=3)).date().isoformat()
-        before_date = (today - timedelta(days=1)).date().isoformat()
-        response = self.api_client.get(reverse('task-list') + f"?created_after={after_date}&created_before={before_date}")
+        self._create_tasks_at([
+            ("Today task", self.now),
+            ("Yesterday task", self.days_ago[1]),
+            ("Two days ago task", self.days_ago[2]),
+            ("Three days ago task", self.days_ago[3]),
+            ("Four days ago task", self.days_ago[4]),
+        ])
+
+        after_date = self.days_ago[3].date().isoformat()
+        before_date = self.days_ago[1].date().isoformat()
+        response = self._list_tasks({'created_after': after_date, 'created_before': before_date})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 3)
@@ -417,39 +411,16 @@ class TaskViewTests(TestCase):
 
     def test_combined_date_and_description_filters(self):
         """Test combining date filters with description filters."""
-        today = timezone.now()
-        yesterday = today - timedelta(days=1)
-        two_days_ago = today - timedelta(days=2)
-
-        TaskFactory(
-            description="Work meeting today",
-            user=self.normal_user,
-            creation_time=today
-        )
-        TaskFactory(
-            description="Work presentation yesterday",
-            user=self.normal_user,
-            creation_time=yesterday
-        )
-        TaskFactory(
-            description="Work report two days ago",
-            user=self.normal_user,
-            creation_time=two_days_ago
-        )
-        TaskFactory(
-            description="Personal task today",
-            user=self.normal_user,
-            creation_time=today
-        )
-        TaskFactory(
-            description="Personal call yesterday",
-            user=self.normal_user,
-            creation_time=yesterday
-        )
-        self.api_client.force_authenticate(user=self.normal_user)
+        self._create_tasks_at([
+            ("Work meeting today", self.now),
+            ("Work presentation yesterday", self.days_ago[1]),
+            ("Work report two days ago", self.days_ago[2]),
+            ("Personal task today", self.now),
+            ("Personal call yesterday", self.days_ago[1]),
+        ])
 
-        after_date = (today - timedelta(days=1)).date().isoformat()
-        response = self.api_client.get(reverse('task-list') + f"?description__contains=Work&created_after={after_date}")
+        after_date = self.days_ago[1].date().isoformat()
+        response = self._list_tasks({'description__contains': 'Work', 'created_after': after_date})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 2)  # Should return 2 tasks
@@ -459,4 +430,126 @@ class TaskViewTests(TestCase):
         self.assertIn("Work presentation yesterday", descriptions)
         self.assertNotIn("Work report two days ago", descriptions)
         self.assertNotIn("Personal task today", descriptions)
-        self.assertNotIn("Personal call yesterday", descriptions)
\ No newline at end of file
+        self.assertNotIn("Personal call yesterday", descriptions)
+
+
+class TaskDescriptionFilterTests(TaskViewTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Shared by every test of the class, inserted once with a single query
+        (
+            cls.buy_groceries,
+            cls.buy_laptop,
+            cls.call_plumber,
+            cls.buy_medicine,
+            cls.groceries_list,
+            cls.email_client,
+            cls.read_book,
+        ) = Task.objects.bulk_create([
+            Task(user=cls.normal_user, description="Buy groceries", completed=True),
+            Task(user=cls.normal_user, description="Buy new laptop", completed=False),
+            Task(user=cls.normal_user, description="Call plumber", completed=True),
+            Task(user=cls.normal_user, description="buy medicine", completed=False),  # Lowercase "buy"
+            Task(user=cls.normal_user, description="groceries shopping list", completed=False),
+            Task(user=cls.normal_user, description="Email the client", completed=False),
+            Task(user=cls.normal_user, description="Read book", completed=False),
+        ])
+
+    def _result_ids(self, response):
+        return {item['id'] for item in response.data['results']}
+
+    def test_filter_by_exact_description(self):
+        """Test filtering tasks by exact description match."""
+        response = self._list_tasks({'description': 'Buy groceries'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.buy_groceries.id})
+
+        response = self._list_tasks({'description': 'buy groceries'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.buy_groceries.id})
+
+        response = self._list_tasks({'description': 'Nonexistent task'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_filter_by_description_contains(self):
+        """Test filtering tasks where description contains a substring."""
+        response = self._list_tasks({'description__contains': 'groceries'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.buy_groceries.id, self.groceries_list.id})
+
+        response = self._list_tasks({'description__contains': 'GROCERIES'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+
+        response = self._list_tasks({'description__contains': 'Buy'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self._result_ids(response),
+            {self.buy_groceries.id, self.buy_laptop.id, self.buy_medicine.id}
+        )
+
+    def test_filter_by_description_startswith(self):
+        """Test filtering tasks where description starts with a specific prefix."""
+        response = self._list_tasks({'description__startswith': 'Buy'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)  # Should match all 3 tasks starting with "Buy"/"buy"
+
+        response = self._list_tasks({'description__startswith': 'buy'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+
+        response = self._list_tasks({'description__startswith': 'Call'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.call_plumber.id})
+
+    def test_filter_by_description_regex(self):
+        """Test filtering tasks where description matches a regex pattern."""
+        response = self._list_tasks({'description__regex': 'er$'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.call_plumber.id}, response.data)
+
+        response = self._list_tasks({'description__regex': '^(Buy|Call)'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self._result_ids(response),
+            {self.buy_groceries.id, self.buy_laptop.id, self.call_plumber.id, self.buy_medicine.id}
+        )
+
+        response = self._list_tasks({'description__regex': '^buy'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+
+        response = self._list_tasks({'description__regex': '^buy.*top$'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.buy_laptop.id})
+
+        # Patterns without regex syntax are matched as a plain case-insensitive substring
+        response = self._list_tasks({'description__regex': r'Grocer'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.buy_groceries.id, self.groceries_list.id})
+
+        # Escapes and bracket expressions are regex syntax, not substrings
+        response = self._list_tasks({'description__regex': r'new\slaptop'})
+        self.assertEqual(self._result_ids(response), {self.buy_laptop.id})
+
+        response = self._list_tasks({'description__regex': r'^[bc]'})
+        self.assertEqual(
+            self._result_ids(response),
+            {self.buy_groceries.id, self.buy_laptop.id, self.call_plumber.id, self.buy_medicine.id}
+        )
+
+    def test_combined_description_and_completion_filters(self):
+        """Test combining description filters with completion status."""
+        response = self._list_tasks({'description__contains': 'Buy', 'completed': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.buy_groceries.id})
+
+        response = self._list_tasks({'description__startswith': 'Buy', 'completed': 'false'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.buy_laptop.id, self.buy_medicine.id})
+
+        response = self._list_tasks({'description__regex': '^(Buy|Call)', 'completed': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._result_ids(response), {self.buy_groceries.id, self.call_plumber.id})
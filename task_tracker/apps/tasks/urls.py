@@ -1,7 +1,6 @@
 from django.urls import path
 from task_tracker.apps.tasks.views import (
     TaskListView,
-    TaskCreateView,
     TaskDetailView,
     TaskUpdateDescriptionView,
     TaskToggleCompletionView,
@@ -10,7 +9,6 @@ from task_tracker.apps.tasks.views import (
 
 urlpatterns = [
     path('', TaskListView.as_view(), name='task-list'),
-    path('create/', TaskCreateView.as_view(), name='task-create'),
     path('<int:pk>/', TaskDetailView.as_view(), name='task-detail'),
     path('<int:pk>/update-description/', TaskUpdateDescriptionView.as_view(), name='task-update-description'),
     path('<int:pk>/toggle-complete/', TaskToggleCompletionView.as_view(), name='task-toggle-complete'),
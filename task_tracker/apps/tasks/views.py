@@ -3,111 +3,142 @@ from django.db.models import QuerySet
 from rest_framework import generics, permissions
 from rest_framework.response import Response
 from rest_framework.filters import OrderingFilter
-from django_filters.rest_framework import DjangoFilterBackend
 
 from task_tracker.apps.tasks.filters import TaskFilter
+from task_tracker.filters import QueryParamFilterBackend
 from task_tracker.permissions import IsOwner
 from task_tracker.apps.tasks.models import Task
+from task_tracker.apps.tasks.pagination import TaskCursorPagination
 from task_tracker.apps.tasks.serializers import ListTasksSerializer, TaskSerializer
 
-from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample, OpenApiResponse
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiExample, OpenApiResponse
 
 logger = logging.getLogger(__name__)
 
 
-@extend_schema(
-    summary="List tasks for the authenticated user",
-    description=(
-            "Retrieve a list of tasks associated with the authenticated user.\n\n"
-            "**Available Filters:**\n"
-            "- `description`: Exact case-insensitive match.\n"
-            "- `description__contains`: Case-insensitive partial match.\n"
-            "- `description__startswith`: Case-insensitive prefix match.\n"
-            "- `description__regex`: Match against a regex.\n"
-            "- `completed`: Boolean filter to retrieve completed or incomplete tasks.\n"
-            "- `created_after`: Tasks created on or after the specified date (`YYYY-MM-DD`).\n"
-            "- `created_before`: Tasks created on or before the specified date (`YYYY-MM-DD`).\n"
-            "- `created_on`: Tasks created on the exact specified date (`YYYY-MM-DD`).\n\n"
-            "**Ordering Options:**\n"
-            "- `creation_time`: Order by the creation time of the tasks.\n"
-            "- `updated_at`: Order by the last update time of the tasks.\n"
-            "- Default ordering: By `completed` status, then by descending `creation_time` and `updated_at`."
-    ),
-    parameters=[
-        OpenApiParameter(name="description", type=str, location=OpenApiParameter.QUERY, description="Case-insensitive exact match for task descriptions."),
-        OpenApiParameter(name="completed", type=bool, location=OpenApiParameter.QUERY, description="Boolean filter to retrieve completed (`true`) or incomplete (`false`) tasks."),
-        OpenApiParameter(name="created_after", type=str, location=OpenApiParameter.QUERY, description="Filter tasks created on or after the specified date (`YYYY-MM-DD`)."),
-        OpenApiParameter(name="created_before", type=str, location=OpenApiParameter.QUERY, description="Filter tasks created on or before the specified date (`YYYY-MM-DD`)."),
-        OpenApiParameter(name="ordering", type=str, location=OpenApiParameter.QUERY, description="Specify the ordering of results (e.g., `creation_time`, `updated_at`)."),
-    ],
-    responses={
-        200: OpenApiResponse(
-            response=ListTasksSerializer(many=True),
-            examples=[
-                OpenApiExample(
-                    name="Successful",
-                    summary="Successful Example",
-                    value=[
-                        {"id": 1, "description": "Sample Task 1", "completed": False, "creation_time": "2025-08-10T10:00:00Z"},
-                        {"id": 2, "description": "Sample Task 2", "completed": True, "creation_time": "2025-08-11T11:00:00Z"},
-                    ]
-                )
-            ]
+class OwnedTasksMixin:
+    """
+    Shared setup of the task views: only the tasks of the authenticated user are reachable.
+
+    Tasks of other users are filtered out of the queryset, so requesting them returns a 404.
+    """
+    serializer_class = TaskSerializer
+    permission_classes = [permissions.IsAuthenticated, IsOwner]
+
+    def get_queryset(self) -> QuerySet[Task]:
+        if getattr(self, "swagger_fake_view", False):
+            return Task.objects.none()
+        # IsOwner only compares `user_id`, so the owner isn't joined. The search vector is
+        # maintained by the database and never serialized
+        return Task.objects.filter(user=self.request.user).defer('search_vector')
+
+
+@extend_schema_view(
+    get=extend_schema(
+        summary="List tasks for the authenticated user",
+        description=(
+                "Retrieve a list of tasks associated with the authenticated user.\n\n"
+                "**Available Filters:**\n"
+                "- `description`: Exact case-insensitive match.\n"
+                "- `description__contains`: Case-insensitive partial match.\n"
+                "- `description__startswith`: Case-insensitive prefix match.\n"
+                "- `description__regex`: Case-insensitive match against a regex (at most 200 characters; "
+                "invalid patterns and nested unbounded quantifiers such as `(a+)+` are rejected with a 400).\n"
+                "- `description__search`: Full-text search (English stemming).\n"
+                "- `completed`: Boolean filter to retrieve completed or incomplete tasks.\n"
+                "- `created_after`: Tasks created on or after the specified date (`YYYY-MM-DD`).\n"
+                "- `created_before`: Tasks created on or before the specified date (`YYYY-MM-DD`).\n"
+                "- `created_on`: Tasks created on the exact specified date (`YYYY-MM-DD`).\n\n"
+                "**Ordering Options:**\n"
+                "- `creation_time`: Order by the creation time of the tasks.\n"
+                "- `updated_at`: Order by the last update time of the tasks.\n"
+                "- Default ordering: Newest first (descending `creation_time`).\n\n"
+                "**Pagination:**\n"
+                "- Cursor based: follow the `next`/`previous` links. No total `count` is returned."
         ),
-        401: OpenApiResponse(description="Authentication credentials were not provided.", examples=[OpenApiExample("Unauthorized Access", {"detail": "Authentication credentials were not provided."})]),
-        400: OpenApiResponse(description="Invalid Query Parameters.", examples=[OpenApiExample("Bad Request", {"detail": "Invalid query parameters.", "errors": {"completed": "Invalid boolean value."}})]),
-    }
+        parameters=[
+            OpenApiParameter(name="description", type=str, location=OpenApiParameter.QUERY, description="Case-insensitive exact match for task descriptions."),
+            OpenApiParameter(name="completed", type=bool, location=OpenApiParameter.QUERY, description="Boolean filter to retrieve completed (`true`) or incomplete (`false`) tasks."),
+            OpenApiParameter(name="created_after", type=str, location=OpenApiParameter.QUERY, description="Filter tasks created on or after the specified date (`YYYY-MM-DD`)."),
+            OpenApiParameter(name="created_before", type=str, location=OpenApiParameter.QUERY, description="Filter tasks created on or before the specified date (`YYYY-MM-DD`)."),
+            OpenApiParameter(name="ordering", type=str, location=OpenApiParameter.QUERY, description="Specify the ordering of results (e.g., `creation_time`, `updated_at`)."),
+        ],
+        responses={
+            200: OpenApiResponse(
+                response=ListTasksSerializer(many=True),
+                examples=[
+                    OpenApiExample(
+                        name="Successful",
+                        summary="Successful Example",
+                        value=[
+                            {"id": 1, "description": "Sample Task 1", "completed": False, "creation_time": "2025-08-10T10:00:00Z"},
+                            {"id": 2, "description": "Sample Task 2", "completed": True, "creation_time": "2025-08-11T11:00:00Z"},
+                        ]
+                    )
+                ]
+            ),
+            401: OpenApiResponse(description="Authentication credentials were not provided.", examples=[OpenApiExample("Unauthorized Access", {"detail": "Authentication credentials were not provided."})]),
+            400: OpenApiResponse(description="Invalid Query Parameters.", examples=[OpenApiExample("Bad Request", {"detail": "Invalid query parameters.", "errors": {"completed": "Invalid boolean value."}})]),
+        }
+    ),
+    post=extend_schema(
+        summary="Create a new task for the authenticated user",
+        description="Create a new task and assign it to the authenticated user.",
+        request=TaskSerializer,
+        responses={
+            201: TaskSerializer,
+            400: OpenApiResponse(description="Validation Error", examples=[OpenApiExample("Invalid Data", {"description": ["This field is required."]})]),
+            401: OpenApiResponse(description="Unauthorized", examples=[OpenApiExample("Unauthorized User", {"detail": "Authentication credentials were not provided."})]),
+        }
+    ),
 )
-class TaskListView(generics.ListAPIView):
-    """List all tasks for the authenticated user."""
-    serializer_class = ListTasksSerializer
-    permission_classes = [permissions.IsAuthenticated, IsOwner]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+class TaskListView(OwnedTasksMixin, generics.ListCreateAPIView):
+    """List the tasks of the authenticated user, or create a new one."""
+    filter_backends = [QueryParamFilterBackend, OrderingFilter]
     filterset_class = TaskFilter
+    pagination_class = TaskCursorPagination
     ordering_fields = ["creation_time", "updated_at"]
-    ordering = ["completed", "-creation_time", "-updated_at"]
+    # Cursor pagination seeks on the first ordering field, so it must be a timestamp
+    ordering = ["-creation_time", "-id"]
+
+    def get_serializer_class(self):
+        if self.request and self.request.method == 'POST':
+            return TaskSerializer
+        return ListTasksSerializer
 
     def get_queryset(self) -> QuerySet[Task]:
         if getattr(self, "swagger_fake_view", False):
             return Task.objects.none()
-        return Task.objects.filter(user=self.request.user)
+        # Only the columns ListTasksSerializer reads, plus the ordering fields the cursor is built
+        # from; the full description stays in the database
+        return (
+            Task.objects.filter(user=self.request.user)
+            .only('id', 'completed', 'creation_time', *self.ordering_fields)
+            .with_short_description()
+        )
 
     def list(self, request, *args, **kwargs):
+        # Skip building the log arguments entirely when INFO is filtered out
+        log_enabled = logger.isEnabledFor(logging.INFO)
         user = request.user
-        if request.query_params:
-            filters = ', '.join([f"{k}={v}" for k, v in request.query_params.items()])
-            logger.info(f"User {user.username} (ID: {user.id}) listed tasks with filters: {filters}")
-        else:
-            logger.info(f"User {user.username} (ID: {user.id}) listed all their tasks")
-
-        return super().list(request, *args, **kwargs)
+        if log_enabled:
+            if request.query_params:
+                filters = ', '.join(f"{k}={v}" for k, v in request.query_params.items())
+                logger.info("User %s (ID: %s) listed tasks with filters: %s", user.username, user.id, filters)
+            else:
+                logger.info("User %s (ID: %s) listed all their tasks", user.username, user.id)
 
+        response = super().list(request, *args, **kwargs)
 
-@extend_schema(
-    summary="Create a new task for the authenticated user",
-    description="Create a new task and assign it to the authenticated user.",
-    request=TaskSerializer,
-    responses={
-        201: TaskSerializer,
-        400: OpenApiResponse(description="Validation Error", examples=[OpenApiExample("Invalid Data", {"description": ["This field is required."]})]),
-        401: OpenApiResponse(description="Unauthorized", examples=[OpenApiExample("Unauthorized User", {"detail": "Authentication credentials were not provided."})]),
-    }
-)
-class TaskCreateView(generics.ListCreateAPIView):
-    """Create a new task for the authenticated user."""
-    serializer_class = TaskSerializer
-    permission_classes = [permissions.IsAuthenticated, IsOwner]
-    http_method_names = ["post"]
+        if log_enabled and request.query_params:
+            logger.info("Filter results for user %s: %s tasks on this page", user.id, len(response.data['results']))
 
-    def get_queryset(self) -> QuerySet[Task]:
-        if getattr(self, "swagger_fake_view", False):
-            return Task.objects.none()
-        return Task.objects.filter(user=self.request.user)
+        return response
 
     def perform_create(self, serializer):
         user = self.request.user
         task = serializer.save(user=user)
-        logger.info(f"User {user.username} (ID: {user.id}) created task with ID: {task.id}, description: '{task.description}'")
+        logger.info("User %s (ID: %s) created task with ID: %s, description: '%s'", user.username, user.id, task.id, task.description)
 
 
 @extend_schema(
@@ -119,16 +150,8 @@ class TaskCreateView(generics.ListCreateAPIView):
         404: OpenApiResponse(description="Not Found", examples=[OpenApiExample("Task Not Found", {"detail": "Not found."})]),
     }
 )
-class TaskDetailView(generics.RetrieveAPIView):
+class TaskDetailView(OwnedTasksMixin, generics.RetrieveAPIView):
     """Retrieve the details of a specific task by ID."""
-    queryset = Task.objects.all()
-    serializer_class = TaskSerializer
-    permission_classes = [permissions.IsAuthenticated, IsOwner]
-
-    def get_queryset(self) -> QuerySet[Task]:
-        if getattr(self, "swagger_fake_view", False):
-            return Task.objects.none()
-        return Task.objects.filter(user=self.request.user)
 
     def retrieve(self, request, *args, **kwargs):
         user = request.user
@@ -137,7 +160,7 @@ class TaskDetailView(generics.RetrieveAPIView):
 
         # Log only if task is found (to avoid logging 404 errors)
         if response.status_code == 200:
-            logger.info(f"User {user.username} (ID: {user.id}) retrieved task with ID: {task_id}")
+            logger.info("User %s (ID: %s) retrieved task with ID: %s", user.username, user.id, task_id)
 
         return response
 
@@ -153,32 +176,18 @@ class TaskDetailView(generics.RetrieveAPIView):
         404: OpenApiResponse(description="Not Found", examples=[OpenApiExample("Task Not Found", {"detail": "Not found."})]),
     }
 )
-class TaskUpdateDescriptionView(generics.UpdateAPIView):
+class TaskUpdateDescriptionView(OwnedTasksMixin, generics.UpdateAPIView):
     """Update the description of a specific task by ID."""
-    queryset = Task.objects.all()
-    serializer_class = TaskSerializer
-    permission_classes = [permissions.IsAuthenticated, IsOwner]
     http_method_names = ["patch"]
 
-    def get_queryset(self) -> QuerySet[Task]:
-        if getattr(self, "swagger_fake_view", False):
-            return Task.objects.none()
-        return Task.objects.filter(user=self.request.user)
-
-    def update(self, request, *args, **kwargs):
-        user = request.user
-        task_id = kwargs.get('pk')
-
-        task = self.get_object()
-        old_description = task.description
-
-        response = super().update(request, *args, **kwargs)
-
-        if 'description' in request.data:
-            new_description = request.data['description']
-            logger.info(f"User {user.username} (ID: {user.id}) updated task ID: {task_id} description from '{old_description}' to '{new_description}'")
-
-        return response
+    def perform_update(self, serializer):
+        user = self.request.user
+        task = serializer.save()
+        if 'description' in serializer.validated_data:
+            logger.info(
+                "User %s (ID: %s) updated task ID: %s description to '%s'",
+                user.username, user.id, task.id, task.description,
+            )
 
 
 @extend_schema(
@@ -190,29 +199,26 @@ class TaskUpdateDescriptionView(generics.UpdateAPIView):
         404: OpenApiResponse(description="Not Found", examples=[OpenApiExample("Task Not Found", {"detail": "Not found."})]),
     }
 )
-class TaskToggleCompletionView(generics.UpdateAPIView):
+class TaskToggleCompletionView(OwnedTasksMixin, generics.UpdateAPIView):
     """Toggle the `completed` status of a task."""
-    queryset = Task.objects.all()
-    serializer_class = TaskSerializer
-    permission_classes = [permissions.IsAuthenticated, IsOwner]
     http_method_names = ["patch"]
 
-    def get_queryset(self) -> QuerySet[Task]:
-        if getattr(self, "swagger_fake_view", False):
-            return Task.objects.none()
-        return Task.objects.filter(user=self.request.user)
-
     def update(self, request, *args, **kwargs):
-        task = self.get_object()
         user = request.user
         task_id = kwargs.get('pk')
 
-        old_status = "completed" if task.completed else "incomplete"
-
-        task.toggle_completion()
+        # Flip the flag with a single UPDATE scoped to the user's tasks, then read the task once
+        # for the response (a missing or foreign task toggles nothing and 404s here)
+        self.get_queryset().filter(pk=task_id).toggle_completion()
+        task = self.get_object()
 
-        new_status = "completed" if task.completed else "incomplete"
-        logger.info(f"User {user.username} (ID: {user.id}) toggled task ID: {task_id} status from {old_status} to {new_status}")
+        if logger.isEnabledFor(logging.INFO):
+            old_status = "incomplete" if task.completed else "completed"
+            new_status = "completed" if task.completed else "incomplete"
+            logger.info(
+                "User %s (ID: %s) toggled task ID: %s status from %s to %s",
+                user.username, user.id, task_id, old_status, new_status,
+            )
 
         serializer = self.get_serializer(task)
         return Response(serializer.data)
@@ -227,24 +233,11 @@ class TaskToggleCompletionView(generics.UpdateAPIView):
         404: OpenApiResponse(description="Not Found", examples=[OpenApiExample("Task Not Found", {"detail": "Not found."})]),
     }
 )
-class TaskDeleteView(generics.DestroyAPIView):
+class TaskDeleteView(OwnedTasksMixin, generics.DestroyAPIView):
     """Delete a specific task by ID."""
-    queryset = Task.objects.all()
-    serializer_class = TaskSerializer
-    permission_classes = [permissions.IsAuthenticated, IsOwner]
-
-    def get_queryset(self) -> QuerySet[Task]:
-        if getattr(self, "swagger_fake_view", False):
-            return Task.objects.none()
-        return Task.objects.filter(user=self.request.user)
-
-    def destroy(self, request, *args, **kwargs):
-        user = request.user
-        task_id = kwargs.get('pk')
 
-        task = self.get_object()
-        task_description = task.description
-
-        logger.info(f"User {user.username} (ID: {user.id}) deleted task ID: {task_id}, description: '{task_description}'")
-
-        return super().destroy(request, *args, **kwargs)
\ No newline at end of file
+    def perform_destroy(self, instance):
+        user = self.request.user
+        task_id = instance.id
+        instance.delete()
+        logger.info("User %s (ID: %s) deleted task ID: %s", user.username, user.id, task_id)
\ No newline at end of file
@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_tracker.apps.users"
+
+    def ready(self):
+        from django.contrib.auth.models import User
+
+        from task_tracker.lookups import ILIKE_LOOKUPS
+
+        # The UserFilter username/email filters use these lookups, see the
+        # `auth_user_*_trgm` indexes in the migrations. Other char columns keep Django's
+        # UPPER() LIKE lookups
+        for field_name in ('username', 'email'):
+            field = User._meta.get_field(field_name)
+            for lookup in ILIKE_LOOKUPS:
+                field.register_lookup(lookup)
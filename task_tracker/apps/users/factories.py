@@ -1,9 +1,21 @@
+from functools import cache
+
 import factory
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from factory.django import DjangoModelFactory
 
 User = get_user_model()
 
+# Plain-text password of the users built by the factories
+DEFAULT_PASSWORD = 'password'
+
+
+@cache
+def hash_password(raw_password):
+    """Hash of `raw_password`, computed once per process."""
+    return make_password(raw_password)
+
 
 class UserFactory(DjangoModelFactory):
     """Factory for creating regular users."""
@@ -13,7 +25,9 @@ class UserFactory(DjangoModelFactory):
 
     username = factory.Sequence(lambda n: f'user{n}')
     email = factory.LazyAttribute(lambda obj: f'{obj.username}@example.com')
-    password = factory.PostGenerationMethodCall('set_password', 'password')
+    # Password hashing is deliberately slow, so users with the same raw password share one
+    # cached hash. Wrap an already hashed value in `factory.Transformer.Force(...)` to store it as is.
+    password = factory.Transformer(DEFAULT_PASSWORD, transform=hash_password)
     is_staff = False
     is_superuser = False
 
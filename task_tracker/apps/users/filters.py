@@ -22,26 +22,12 @@ class UserFilter(django_filters.FilterSet):
         model = User
         fields = ['username', 'email']
 
-    def __init__(self, data=None, queryset=None, *, request=None, prefix=None):
-        """Initialize the UserFilter with the request to enable logging."""
-
-        super().__init__(data, queryset, request=request, prefix=prefix)
-        self.request = request
-
-        if request and data:
-            admin_user_id = getattr(request.user, 'id', 'anonymous')
-            applied_filters = [k for k in data.keys() if k in self.Meta.fields]
-
-            if applied_filters:
-                logger.info(f"Admin user {admin_user_id} filtered users by: {', '.join(applied_filters)}")
-
     def filter_queryset(self, queryset):
         filtered_queryset = super().filter_queryset(queryset)
 
-        if hasattr(self, 'request') and self.request and self.data:
+        # Only the search terms are logged: counting the users would cost two extra COUNT(*) queries
+        if self.request and self.data and logger.isEnabledFor(logging.INFO):
             admin_user_id = getattr(self.request.user, 'id', 'anonymous')
-            original_count = queryset.count()
-            filtered_count = filtered_queryset.count()
 
             search_terms = []
             if 'username' in self.data:
@@ -51,9 +37,6 @@ class UserFilter(django_filters.FilterSet):
 
             terms_str = " and ".join(search_terms) if search_terms else "no specific terms"
 
-            logger.info(
-                f"User search by admin {admin_user_id}: {filtered_count} users found "
-                f"(from {original_count}) using {terms_str}"
-            )
+            logger.info("User search by admin %s using %s", admin_user_id, terms_str)
 
-        return filtered_queryset
\ No newline at end of file
+        return filtered_queryset
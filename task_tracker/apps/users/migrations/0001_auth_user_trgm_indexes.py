@@ -0,0 +1,28 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from task_tracker.operations import PostgresRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        # `auth_user` belongs to django.contrib.auth, so its indexes can't be declared in a
+        # model's Meta. They back the UserFilter `username`/`email` icontains filters, which
+        # compile to `ILIKE` (see `task_tracker.lookups`).
+        PostgresRunSQL(
+            sql=[
+                "CREATE INDEX IF NOT EXISTS auth_user_username_trgm ON auth_user USING gin (username gin_trgm_ops);",
+                "CREATE INDEX IF NOT EXISTS auth_user_email_trgm ON auth_user USING gin (email gin_trgm_ops);",
+            ],
+            reverse_sql=[
+                "DROP INDEX IF EXISTS auth_user_username_trgm;",
+                "DROP INDEX IF EXISTS auth_user_email_trgm;",
+            ],
+        ),
+    ]
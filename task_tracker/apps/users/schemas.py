@@ -0,0 +1,193 @@
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiExample, OpenApiResponse
+
+from .serializers import UserCreateSerializer, UserUpdateSerializer, UserSerializer
+
+# OpenAPI documentation of the user viewsets, applied as class decorators in `views.py`
+user_registration_schema = extend_schema_view(
+    create=extend_schema(
+        summary="Register a new user",
+        description=(
+                "This endpoint allows public registration of a new user account. "
+                "No authentication is required to access this endpoint."
+        ),
+        request=UserCreateSerializer,
+        responses={
+            201: UserSerializer,
+            400: OpenApiResponse(
+                description="Invalid input data",
+                examples=[
+                    OpenApiExample(
+                        "Validation Error",
+                        summary="Invalid data example",
+                        value={"username": ["This field is required."]}
+                    )
+                ]
+            )
+        }
+    )
+)
+
+
+user_profile_schema = extend_schema_view(
+    retrieve=extend_schema(
+        summary="Retrieve a user profile",
+        description=(
+                "Retrieve the profile details of a specific user by their ID.\n\n"
+                "**Access rules:**\n"
+                "- Authenticated users can only access their own profile.\n"
+                "- Staff and superusers can access any profile."
+        ),
+        responses={
+            200: UserSerializer,
+            403: OpenApiResponse(
+                description="Forbidden",
+                examples=[
+                    OpenApiExample(
+                        "Forbidden Access",
+                        summary="User trying to access another's profile",
+                        value={"detail": "You do not have permission to perform this action."}
+                    )
+                ]
+            ),
+            404: OpenApiResponse(
+                description="Profile not found",
+                examples=[
+                    OpenApiExample(
+                        "Not Found",
+                        value={"detail": "Not found."}
+                    )
+                ]
+            )
+        }
+    ),
+    update=extend_schema(
+        summary="Update a user profile",
+        description=(
+                "Perform a complete update of a specific user profile.\n\n"
+                "**Access rules:**\n"
+                "- Users can only update their own profile.\n"
+                "- Staff and superusers can update any profile."
+        ),
+        request=UserUpdateSerializer,
+        responses={
+            200: UserSerializer,
+            400: OpenApiResponse(
+                description="Invalid input data",
+                examples=[
+                    OpenApiExample(
+                        "Validation Error",
+                        value={"email": ["Enter a valid email address."]}
+                    )
+                ]
+            ),
+            403: OpenApiResponse(
+                description="Permission denied",
+                examples=[
+                    OpenApiExample(
+                        "Forbidden Access",
+                        value={"detail": "You do not have permission to perform this action."}
+                    )
+                ]
+            )
+        }
+    ),
+    partial_update=extend_schema(
+        summary="Partially update a user profile",
+        description=(
+                "Update specific fields of a user profile without replacing the whole object.\n\n"
+                "**Access rules:**\n"
+                "- Users can partially update their own profile.\n"
+                "- Staff and superusers can partially update any profile."
+        ),
+        request=UserUpdateSerializer,
+        responses={
+            200: UserSerializer,
+            400: OpenApiResponse(
+                description="Invalid input data",
+                examples=[
+                    OpenApiExample(
+                        "Validation Error",
+                        value={"email": ["Enter a valid email address."]}
+                    )
+                ]
+            ),
+            403: OpenApiResponse(
+                description="Permission denied",
+                examples=[
+                    OpenApiExample(
+                        "Forbidden Access",
+                        value={"detail": "You do not have permission to perform this action."}
+                    )
+                ]
+            )
+        }
+    ),
+    destroy=extend_schema(
+        summary="Delete a user profile",
+        description=(
+                "Delete a user profile by its ID.\n\n"
+                "**Access rules:**\n"
+                "- Users can delete their own profile.\n"
+                "- Staff and superusers can delete any profile."
+        ),
+        responses={
+            204: OpenApiResponse(description="Successfully deleted."),
+            403: OpenApiResponse(
+                description="Permission denied",
+                examples=[
+                    OpenApiExample(
+                        "Forbidden Access",
+                        value={"detail": "You do not have permission to perform this action."}
+                    )
+                ]
+            ),
+            404: OpenApiResponse(description="Profile not found.")
+        }
+    )
+)
+
+
+user_list_schema = extend_schema_view(
+    list=extend_schema(
+        summary="List users with filtering options",
+        description=(
+                "Retrieve a list of all registered users with optional filters.\n\n"
+                "**Access rules:**\n"
+                "- Staff and superusers can view all registered users.\n"
+                "- Regular users can only see their own profile."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="username",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Filter users by username (case insensitive)."
+            ),
+            OpenApiParameter(
+                name="email",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Filter users by email address (case insensitive)."
+            )
+        ],
+        responses={
+            200: OpenApiResponse(
+                response=UserSerializer(many=True),
+                examples=[
+                    OpenApiExample(
+                        "Filtered List",
+                        value=[
+                            {
+                                "id": 1,
+                                "username": "john_doe",
+                                "email": "john@example.com",
+                                "first_name": "John",
+                                "last_name": "Doe"
+                            }
+                        ]
+                    )
+                ]
+            )
+        }
+    )
+)
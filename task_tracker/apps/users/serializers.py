@@ -24,8 +24,11 @@ class UserCreateSerializer(PasswordSerializer, serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ['username', 'email', 'first_name', 'last_name', 'password', 'is_active']
+        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'password', 'is_active']
         extra_kwargs = {
+            'id': {
+                'help_text': "Unique identifier of the created user."
+            },
             'username': {
                 'help_text': "Unique username for the user. This field is required."
             },
@@ -44,6 +47,11 @@ class UserCreateSerializer(PasswordSerializer, serializers.ModelSerializer):
             },
         }
 
+    def create(self, validated_data):
+        """Create the user with a hashed password in a single INSERT."""
+        password = validated_data.pop('password')
+        return User.objects.create_user(password=password, **validated_data)
+
 
 class UserUpdateSerializer(PasswordSerializer, serializers.ModelSerializer):
     """
@@ -70,15 +78,22 @@ class UserUpdateSerializer(PasswordSerializer, serializers.ModelSerializer):
         }
 
     def update(self, instance, validated_data):
-        """Custom update method for handling password updates alongside other fields."""
+        """
+        Custom update method for handling password updates alongside other fields.
+
+        Only the columns present in the request are written.
+        """
         password = validated_data.pop('password', None)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
 
+        update_fields = list(validated_data)
         if password is not None:
             instance.set_password(password)
+            update_fields.append('password')
 
-        instance.save()
+        if update_fields:
+            instance.save(update_fields=update_fields)
         return instance
 
 
@@ -2,24 +2,27 @@ from django.urls import reverse
 from rest_framework import status
 
 from task_tracker.test import TestCase
-from task_tracker.apps.users.factories import UserFactory
+from task_tracker.apps.users.factories import DEFAULT_PASSWORD, UserFactory
 
 
 class TestAuthentication(TestCase):
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Created once for the class, each test runs in a transaction that is rolled back
+        # The factory assigns a precomputed hash of DEFAULT_PASSWORD, no hashing per user
+        cls.regular_user = UserFactory()
+        cls.raw_password = DEFAULT_PASSWORD
+
+        # Endpoints
+        cls.token_url = reverse('token_obtain_pair')
+        cls.refresh_url = reverse('token_refresh')
+
     def setUp(self):
         super().setUp()
         self.api_client.logout()
 
-        self.regular_user = UserFactory()
-        self.raw_password = 'testpassword123'
-        self.regular_user.set_password(self.raw_password)
-        self.regular_user.save()
-
-        # Endpoints
-        self.token_url = reverse('token_obtain_pair')
-        self.refresh_url = reverse('token_refresh')
-
     def test_token_obtain(self):
         """Test obtaining JWT token with valid credentials."""
         response = self.api_client.post(
@@ -3,6 +3,7 @@ from django.contrib.auth.models import User
 from django.test import TestCase
 
 from task_tracker.apps.users.factories import UserFactory, AdminUserFactory
+from task_tracker.lookups import ILikeIContains
 
 
 class TestUserModel(TestCase):
@@ -44,6 +45,14 @@ class TestUserModel(TestCase):
         self.assertFalse(user.is_staff)
         self.assertFalse(user.is_superuser)
 
+    def test_user_factory_hashes_passed_password(self):
+        """Test that a raw password passed to the UserFactory is stored hashed."""
+        first, second = UserFactory(password="secret"), UserFactory(password="secret")
+
+        self.assertNotEqual(first.password, "secret")
+        self.assertTrue(first.check_password("secret"))
+        self.assertEqual(first.password, second.password)
+
     def test_admin_factory(self):
         """Test that the AdminUserFactory works correctly."""
         admin = AdminUserFactory()
@@ -77,4 +86,12 @@ class TestUserModel(TestCase):
 
         self.assertFalse(user.has_perm("auth.add_user"))
         self.assertFalse(user.has_perm("auth.change_user"))
-        self.assertFalse(user.has_perm("auth.delete_user"))
\ No newline at end of file
+        self.assertFalse(user.has_perm("auth.delete_user"))
+
+    def test_filtered_fields_use_ilike_lookups(self):
+        """Test the case-insensitive username/email lookups compile to ILIKE on PostgreSQL."""
+        for field_name in ('username', 'email'):
+            with self.subTest(field_name):
+                field = User._meta.get_field(field_name)
+                self.assertIs(field.get_lookup('icontains'), ILikeIContains)
+        self.assertIsNot(User._meta.get_field('first_name').get_lookup('icontains'), ILikeIContains)
@@ -1,5 +1,9 @@
+from functools import lru_cache
+
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from task_tracker.test import TestCase
@@ -9,28 +13,26 @@ User = get_user_model()
 
 
 class TestUserViews(TestCase):
-    def setUp(self):
-        super().setUp()
-
-        self.regular_user = UserFactory()
-        self.regular_password = 'testpassword123'
-        self.regular_user.set_password(self.regular_password)
-        self.regular_user.save()
-
-        self.another_user = UserFactory()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Created once for the class, each test runs in a transaction that is rolled back
+        cls.regular_user = UserFactory()
 
-        self.staff_user = UserFactory(is_staff=True, is_superuser=False)
+        cls.another_user = UserFactory()
 
-        self.inactive_user = UserFactory(is_active=False)
+        cls.staff_user = UserFactory(is_staff=True, is_superuser=False)
 
-        self.register_url = reverse('user-register-list')
-        self.users_list_url = reverse('user-list-list')
+        cls.inactive_user = UserFactory(is_active=False)
 
-        # Helper method to get profile URL for a specific user
-        def get_profile_url(user_id):
-            return reverse('user-profile-detail', kwargs={'pk': user_id})
+        cls.register_url = reverse('user-register-list')
+        cls.users_list_url = reverse('user-list-list')
 
-        self.get_profile_url = get_profile_url
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_profile_url(user_id):
+        """Helper method to get profile URL for a specific user, resolved once per user ID"""
+        return reverse('user-profile-detail', kwargs={'pk': user_id})
 
     def test_create_user_happy_path(self):
         """Test successfully creating a new user."""
@@ -52,73 +54,29 @@ class TestUserViews(TestCase):
 
         self.assertNotIn('password', response.data)
 
-        self.assertTrue(User.objects.filter(username=new_user_data['username']).exists())
-
-    def test_create_user_weak_password(self):
-        """Test creating a user with a weak password that fails validation."""
-        new_user_data = {
-            'username': 'weakpassuser',
-            'email': 'weak@example.com',
-            'password': 'password',
-            'first_name': 'Weak',
-            'last_name': 'Password'
-        }
-
-        response = self.api_client.post(self.register_url, new_user_data)
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('password', response.data)
-
-    def test_create_user_short_password(self):
-        """Test creating a user with a password that's too short."""
-        new_user_data = {
-            'username': 'shortpassuser',
-            'email': 'short@example.com',
-            'password': 'Sh0rt!',
-            'first_name': 'Short',
-            'last_name': 'Password'
-        }
-
-        response = self.api_client.post(self.register_url, new_user_data)
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('password', response.data)
-
-    def test_create_user_numeric_password(self):
-        """Test creating a user with an entirely numeric password."""
-        new_user_data = {
-            'username': 'numericpassuser',
-            'email': 'numeric@example.com',
-            'password': '12345678',
-            'first_name': 'Numeric',
-            'last_name': 'Password'
-        }
-
-        response = self.api_client.post(self.register_url, new_user_data)
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('password', response.data)
+        # The response carries the new user's ID, look it up by primary key
+        user = User.objects.get(pk=response.data['id'])
+        self.assertTrue(user.check_password(new_user_data['password']))
 
     def test_create_user_validation_errors(self):
-        """Test that validation errors provide sufficient information."""
-        new_user_data = {
-            'username': '',
-            'email': 'not-an-email',
-            'password': 'short'
-        }
-
-        response = self.api_client.post(self.register_url, new_user_data)
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-        # Check for specific validation messages
-        self.assertIn('username', response.data)
-        self.assertIn('email', response.data)
-        self.assertIn('password', response.data)
+        """Test that invalid registrations are rejected with an error for every invalid field."""
+        cases = [
+            ('weak password', {'username': 'weakpassuser', 'email': 'weak@example.com', 'password': 'password'}, ['password']),
+            ('short password', {'username': 'shortpassuser', 'email': 'short@example.com', 'password': 'Sh0rt!'}, ['password']),
+            ('numeric password', {'username': 'numericpassuser', 'email': 'numeric@example.com', 'password': '12345678'}, ['password']),
+            ('invalid fields', {'username': '', 'email': 'not-an-email', 'password': 'short'}, ['username', 'email', 'password']),
+        ]
+
+        for label, new_user_data, invalid_fields in cases:
+            with self.subTest(label):
+                response = self.api_client.post(self.register_url, new_user_data)
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                for field in invalid_fields:
+                    self.assertIn(field, response.data)
 
     def test_list_users_as_admin(self):
         """Test that admin users can see all users including inactive ones."""
-        self.api_client.logout()
         self.api_client.force_authenticate(self.user)
 
         response = self.api_client.get(self.users_list_url)
@@ -135,7 +93,6 @@ class TestUserViews(TestCase):
 
     def test_list_users_as_regular_user(self):
         """Test that regular users can only see their own details."""
-        self.api_client.logout()
         self.api_client.force_authenticate(self.regular_user)
 
         response = self.api_client.get(self.users_list_url)
@@ -162,8 +119,8 @@ class TestUserViews(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-        created_user = User.objects.get(username=new_user_data['username'])
-        self.assertTrue(created_user.is_active)
+        is_active = User.objects.filter(pk=response.data['id']).values_list('is_active', flat=True).first()
+        self.assertTrue(is_active)
 
     def test_regular_user_cannot_delete_others(self):
         """Test that a regular user cannot delete other users."""
@@ -179,10 +136,14 @@ class TestUserViews(TestCase):
         self.api_client.force_authenticate(self.regular_user)
 
         # Delete self
-        response = self.api_client.delete(self.get_profile_url(self.regular_user.id))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.delete(self.get_profile_url(self.regular_user.id))
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(User.objects.filter(id=self.regular_user.id).exists())
+        # The profile is looked up once, not again for the log record
+        lookups = [q for q in queries if q['sql'].startswith('SELECT') and 'FROM "auth_user" WHERE' in q['sql']]
+        self.assertEqual(len(lookups), 1, lookups)
 
     def test_admin_can_delete_any_user(self):
         """Test that an admin user can delete any user."""
@@ -239,11 +200,23 @@ class TestUserViews(TestCase):
         self.assertEqual(login_response.status_code, status.HTTP_200_OK)
         self.assertIn('access', login_response.data)
 
+    def test_partial_update_is_logged_once(self):
+        """Test a PATCH is logged once, as a partial update."""
+        self.api_client.force_authenticate(self.regular_user)
+
+        with self.assertLogs('task_tracker.apps.users.views', level='INFO') as logs:
+            response = self.api_client.patch(self.get_profile_url(self.regular_user.id), {'first_name': 'Renamed'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('partially updated', logs.output[0])
+
     def test_regular_user_cannot_view_other_profiles(self):
         """Test that regular users cannot view profiles of other users."""
         self.api_client.force_authenticate(self.regular_user)
 
-        response = self.api_client.get(self.get_profile_url(self.another_user.id))
+        with self.assertLogs('task_tracker.permissions', level='WARNING'):
+            response = self.api_client.get(self.get_profile_url(self.another_user.id))
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
@@ -270,17 +243,30 @@ class TestUserViews(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['username'], self.inactive_user.username)
 
+    def test_missing_or_malformed_profile_returns_not_found(self):
+        """Test that unknown and non-numeric profile IDs return a 404 rather than a 403 or 500."""
+        self.api_client.force_authenticate(self.regular_user)
+
+        for user_id in (0, 'not-a-number'):
+            with self.subTest(user_id=user_id):
+                response = self.api_client.get(self.get_profile_url(user_id))
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_filter_users_by_username(self):
         """Test that users can be filtered by username."""
         self.api_client.force_authenticate(self.staff_user)
 
         specific_user = UserFactory(username="target_username")
-        response = self.api_client.get(
-            self.users_list_url, {'username': 'target_username'}
-        )
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.get(
+                self.users_list_url, {'username': 'target_username'}
+            )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
+        # The COUNT(*) and the page, which only loads the serialized columns
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn('"password"', queries[-1]['sql'])
 
         result_user = response.data['results'][0]
         self.assertEqual(result_user['username'], specific_user.username)
@@ -0,0 +1,15 @@
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class QueryParamFilterBackend(DjangoFilterBackend):
+    """
+    `DjangoFilterBackend` that leaves the queryset untouched when the request has no query params.
+
+    Unfiltered requests (the most common list call) skip building, validating and applying the
+    view's FilterSet entirely; with no params it would not have filtered anything anyway.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not request.query_params:
+            return queryset
+        return super().filter_queryset(request, queryset, view)
@@ -0,0 +1,36 @@
+from django.db.models import lookups
+
+
+class ILikeMixin:
+    """
+    Compiles a case-insensitive pattern lookup to `ILIKE` on PostgreSQL.
+
+    Django emits `UPPER(column::text) LIKE UPPER(%s)` for these lookups, which can't use a
+    trigram (`gin_trgm_ops`) index on the column. `column ILIKE %s` can, and matches the same
+    rows. Non-literal right-hand sides (e.g. `F()` expressions) keep Django's default SQL.
+    """
+
+    def as_postgresql(self, compiler, connection):
+        if not self.rhs_is_direct_value() or self.bilateral_transforms:
+            return self.as_sql(compiler, connection)
+
+        # Skip BuiltinLookup.process_lhs, it wraps the column in UPPER(...::text)
+        lhs_sql, lhs_params = lookups.Lookup.process_lhs(self, compiler, connection)
+        # Escapes `%`, `_` and `\` in the value and adds the wildcards of the lookup
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", (*lhs_params, *rhs_params)
+
+
+class ILikeIContains(ILikeMixin, lookups.IContains):
+    pass
+
+
+class ILikeIStartsWith(ILikeMixin, lookups.IStartsWith):
+    pass
+
+
+class ILikeIEndsWith(ILikeMixin, lookups.IEndsWith):
+    pass
+
+
+ILIKE_LOOKUPS = [ILikeIContains, ILikeIStartsWith, ILikeIEndsWith]
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+class PostgresOnlyMixin:
+    """
+    Mixin for migration operations that only make sense on PostgreSQL.
+
+    The migration state is always updated, so models and migrations stay in sync on
+    every backend, but the database change itself is skipped on other vendors
+    (e.g. the SQLite database used for local test runs).
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class PostgresAddIndex(PostgresOnlyMixin, migrations.AddIndex):
+    """Adds an index that relies on PostgreSQL-only features (GIN, operator classes, ...)."""
+
+
+class PostgresRunSQL(PostgresOnlyMixin, migrations.RunSQL):
+    """Runs raw SQL (triggers, functions, ...) only on PostgreSQL."""
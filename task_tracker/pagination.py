@@ -0,0 +1,59 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+# Below this many rows an exact COUNT(*) is cheap enough
+ESTIMATED_COUNT_THRESHOLD = 10_000
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that avoids `COUNT(*)` over large, unfiltered PostgreSQL tables.
+
+    When the queryset has no WHERE clause, the planner's row estimate (`pg_class.reltuples`)
+    is used as the count once it goes over `ESTIMATED_COUNT_THRESHOLD`. Filtered querysets,
+    small tables and other database vendors get the exact count.
+
+    The estimate is only as fresh as the table's last ANALYZE, so for unfiltered querysets
+    `count` and the page bounds derived from it are approximate: the last pages may 404 or
+    a `next` link may point past the end of the data.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is not None and estimate > ESTIMATED_COUNT_THRESHOLD:
+            return estimate
+        return super().count
+
+    def _estimated_count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return None
+
+        query = queryset.query
+        if query.where or query.is_sliced or query.distinct or query.combinator:
+            return None
+
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # reltuples is -1 (or 0) until the table has been vacuumed/analyzed
+        if not row or row[0] <= 0:
+            return None
+        return int(row[0])
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """Page number pagination backed by `EstimatedCountPaginator`, for the unfiltered staff user list."""
+    django_paginator_class = EstimatedCountPaginator
@@ -1,25 +1,40 @@
+import logging
+
 from rest_framework import permissions
 
+logger = logging.getLogger(__name__)
+
 
 class IsOwner(permissions.BasePermission):
     """Custom permission to only allow owners of a task to view or edit it."""
 
     def has_object_permission(self, request, view, obj):
-        # Check if the requesting user is the owner of the object
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
+        # Check if the requesting user is the owner of the object. Compare the foreign key
+        # value when the object has one, so the owner row doesn't have to be loaded
+        user = request.user
+        owner_id = getattr(obj, 'user_id', None)
+        if owner_id is not None:
+            return owner_id == user.pk
 
-        return obj == request.user
+        # Objects without an owner key (e.g. users themselves) are compared directly
+        return getattr(obj, 'user', obj) == user
 
 
 class IsOwnerOrStaff(IsOwner):
     """Custom permission to only allow owners of an object to edit it."""
 
     def has_object_permission(self, request, view, obj):
-        # Staff can do anything
-        if request.user.is_staff:
+        # Staff can do anything, like in the user list
+        user = request.user
+        if user.is_staff or user.is_superuser:
             return True
 
-        return super().has_object_permission(request, view, obj)
+        allowed = super().has_object_permission(request, view, obj)
+        if not allowed:
+            logger.warning(
+                "User %s (ID: %s) was denied access to %s ID: %s",
+                user.username, user.id, obj._meta.model_name, obj.pk,
+            )
+        return allowed
 
 
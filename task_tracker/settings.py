@@ -88,6 +88,23 @@ else:
         }
     }
 
+# Tests run against an in-memory SQLite database, which skips the disk/WAL writes of every
+# fixture INSERT. PostgreSQL-only migrations (trigram/full-text indexes and triggers) are
+# skipped there; set TEST_DB=postgres to run the suite against the configured PostgreSQL.
+# Only `manage.py test` switches databases, not e.g. `manage.py shell -c ...`.
+if os.sys.argv[1:2] == ['test'] and config('TEST_DB', default='sqlite') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
+# PBKDF2 is deliberately slow, and tests hash a password for nearly every user they create.
+# MD5 is only acceptable because test databases are thrown away.
+if os.sys.argv[1:2] == ['test']:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -136,7 +153,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_FILTER_BACKENDS': [
-        'django_filters.rest_framework.DjangoFilterBackend',
+        'task_tracker.filters.QueryParamFilterBackend',
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
@@ -9,12 +9,22 @@ from rest_framework.test import APIClient
 class TestCaseMixin:
     fixtures = []
 
+    @classmethod
+    def create_admin_user(cls):
+        return AdminUserFactory(username='admin')
+
     def setUp(self):
         super().setUp()
 
-        self.user = AdminUserFactory(username='admin')
+        if not hasattr(self, 'user'):
+            self.user = self.create_admin_user()
         self.api_client = APIClient()
         self.api_client.force_authenticate(self.user)
 
 
-class TestCase(TestCaseMixin, BaseTestCase): ...
+class TestCase(TestCaseMixin, BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Created once per class; each test runs in a transaction that is rolled back
+        cls.user = cls.create_admin_user()